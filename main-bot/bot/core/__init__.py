@@ -2,6 +2,7 @@
 
 from bot.core.config import get_settings
 from bot.core.i18n import get_texts, TextManager
+from bot.core.callback_data import FeedPostCallback, RatePostCallback
 from bot.core.keyboards import (
     get_start_keyboard,
     get_onboarding_keyboard,
@@ -13,12 +14,14 @@ from bot.core.keyboards import (
     get_language_selection_keyboard,
     get_training_complete_keyboard,
     get_retrain_keyboard,
+    get_bonus_training_keyboard,
     get_cancel_keyboard,
     get_add_channel_keyboard,
     get_add_bonus_channel_keyboard,
     get_miniapp_keyboard,
     get_channels_view_keyboard,
     get_how_it_works_keyboard,
+    get_confirm_keyboard,
 )
 from bot.core.message_manager import MessageManager
 from bot.core.message_registry import MessageRegistry, MessageType, ManagedMessage
@@ -28,6 +31,8 @@ __all__ = [
     "get_settings",
     "get_texts",
     "TextManager",
+    "FeedPostCallback",
+    "RatePostCallback",
     "get_start_keyboard",
     "get_onboarding_keyboard",
     "get_training_post_keyboard",
@@ -38,12 +43,14 @@ __all__ = [
     "get_language_selection_keyboard",
     "get_training_complete_keyboard",
     "get_retrain_keyboard",
+    "get_bonus_training_keyboard",
     "get_cancel_keyboard",
     "get_add_channel_keyboard",
     "get_add_bonus_channel_keyboard",
     "get_miniapp_keyboard",
     "get_channels_view_keyboard",
     "get_how_it_works_keyboard",
+    "get_confirm_keyboard",
     "MessageManager",
     "MessageType",
     "ManagedMessage",
@@ -0,0 +1,15 @@
+"""Typed callback data factories for inline keyboards."""
+
+from aiogram.filters.callback_data import CallbackData
+
+
+class FeedPostCallback(CallbackData, prefix="feed"):
+    """Feed post interaction button (packs as feed:<action>:<post_id>)."""
+    action: str
+    post_id: int
+
+
+class RatePostCallback(CallbackData, prefix="rate"):
+    """Training post rating button (packs as rate:<action>:<post_id>)."""
+    action: str
+    post_id: int
@@ -1,6 +1,6 @@
 from pydantic_settings import BaseSettings
-from functools import lru_cache
-from typing import List
+from functools import cached_property, lru_cache
+from typing import List, Tuple
 
 
 class Settings(BaseSettings):
@@ -39,6 +39,11 @@ class Settings(BaseSettings):
         """Get supported languages as a list."""
         return [lang.strip() for lang in self.supported_languages.split(",") if lang.strip()]
     
+    @cached_property
+    def default_training_channels_list(self) -> Tuple[str, ...]:
+        """Default training channels as stripped, non-empty entries (parsed once)."""
+        return tuple(ch.strip() for ch in self.default_training_channels.split(",") if ch.strip())
+    
     
     class Config:
         env_file = ".env"
@@ -4,7 +4,8 @@ Supports multiple languages with per-user language storage.
 """
 import json
 from pathlib import Path
-from typing import Dict, Optional, List
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, List
 from functools import lru_cache
 
 # Base path for language files
@@ -57,8 +58,8 @@ def normalize_telegram_language(language_code: Optional[str], supported_language
 
 
 @lru_cache(maxsize=10)  # Cache up to 10 language files
-def _load_language_file(lang: str) -> Dict[str, str]:
-    """Load and cache texts for specified language."""
+def _load_language_file(lang: str) -> Mapping[str, str]:
+    """Load and cache texts for specified language (read-only, shared)."""
     lang_file = LANGS_DIR / f"{lang}.json"
     
     if not lang_file.exists():
@@ -70,7 +71,7 @@ def _load_language_file(lang: str) -> Dict[str, str]:
         lang_file = LANGS_DIR / f"{default}.json"
     
     with open(lang_file, "r", encoding="utf-8") as f:
-        return json.load(f)
+        return MappingProxyType(json.load(f))
 
 
 class TextManager:
@@ -82,6 +83,8 @@ class TextManager:
         message = texts.get("welcome", name="John")
     """
     
+    __slots__ = ("lang", "_texts")
+    
     def __init__(self, lang: str = None):
         # Get supported languages and default from config
         supported = get_supported_languages()
@@ -91,18 +94,18 @@ class TextManager:
             lang = default
         
         self.lang = lang if lang in supported else default
-        self._texts = _load_language_file(self.lang)
-        self._fallback = _load_language_file(default) if self.lang != default else {}
+        texts = _load_language_file(self.lang)
+        if self.lang != default:
+            # Merge the default language underneath once, so lookups are a single dict hit
+            texts = MappingProxyType({**_load_language_file(default), **texts})
+        self._texts = texts
     
     def get(self, key: str, default: Optional[str] = None, **kwargs) -> str:
         """
         Get text by key with optional formatting.
         Falls back to English if key not found in current language.
         """
-        text = self._texts.get(key)
-        
-        if text is None:
-            text = self._fallback.get(key, default)
+        text = self._texts.get(key, default)
         
         if text is None:
             return f"[{key}]"  # Debug placeholder for missing keys
@@ -121,9 +124,10 @@ class TextManager:
     
     def __contains__(self, key: str) -> bool:
         """Check if key exists."""
-        return key in self._texts or key in self._fallback
+        return key in self._texts
 
 
+@lru_cache(maxsize=16)  # One TextManager per language, shared across handlers
 def get_texts(lang: Optional[str] = None) -> TextManager:
     """Get TextManager instance for specified language."""
     if lang is None:
@@ -131,6 +135,7 @@ def get_texts(lang: Optional[str] = None) -> TextManager:
     return TextManager(lang)
 
 
+@lru_cache(maxsize=1)  # Settings are immutable at runtime
 def get_supported_languages() -> List[str]:
     """Get supported languages from config."""
     from bot.core.config import get_settings
@@ -138,6 +143,7 @@ def get_supported_languages() -> List[str]:
     return settings.supported_languages_list
 
 
+@lru_cache(maxsize=1)
 def get_default_language() -> str:
     """Get default language from config."""
     from bot.core.config import get_settings
@@ -149,8 +155,8 @@ def get_default_language() -> str:
 # DEPRECATED: Use get_texts(lang) instead
 # Initialize after get_default_language is defined
 def _init_legacy_texts() -> Dict[str, str]:
-    """Initialize legacy TEXTS dict."""
-    return _load_language_file(get_default_language())
+    """Initialize legacy TEXTS dict (a copy, so set_language can't touch the cache)."""
+    return dict(_load_language_file(get_default_language()))
 
 TEXTS: Dict[str, str] = {}
 # Will be initialized on first import
@@ -158,7 +164,7 @@ try:
     TEXTS = _init_legacy_texts()
 except Exception:
     # Fallback if config not available
-    TEXTS = _load_language_file("en_US")
+    TEXTS = dict(_load_language_file("en_US"))
 
 
 def set_language(lang: str) -> None:
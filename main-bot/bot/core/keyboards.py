@@ -2,9 +2,12 @@
 Keyboard builders for inline buttons.
 """
 
+from functools import lru_cache
+
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton, WebAppInfo
 from bot.core.config import get_settings
-from bot.core.i18n import TEXTS, get_texts, get_supported_languages
+from bot.core.i18n import get_texts, get_supported_languages
+from bot.core.callback_data import FeedPostCallback, RatePostCallback
 
 settings = get_settings()
 
@@ -35,6 +38,7 @@ def get_language_flag(lang: str) -> str:
     return LANGUAGE_FLAGS.get(lang, "🌐")
 
 
+@lru_cache(maxsize=32)
 def get_language_selection_keyboard(lang: str = "en_US") -> InlineKeyboardMarkup:
     """Language selection keyboard with languages in vertical list with flags."""
     t = get_texts(lang)
@@ -55,6 +59,7 @@ def get_language_selection_keyboard(lang: str = "en_US") -> InlineKeyboardMarkup
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
+@lru_cache(maxsize=32)
 def get_start_keyboard(lang: str = "en_US") -> InlineKeyboardMarkup:
     """Initial onboarding keyboard."""
     t = get_texts(lang)
@@ -63,100 +68,106 @@ def get_start_keyboard(lang: str = "en_US") -> InlineKeyboardMarkup:
     next_flag = get_language_flag(next_lang)
     
     # Get button text in current language and format with flags
-    change_lang_template = t.get("start_btn_change_language", default="{flag1} Change Language {flag2}")
+    change_lang_template = t.get("start_btn_change_language")
     change_lang_text = change_lang_template.format(flag1=current_flag, flag2=next_flag)
     
     return InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(text=t.get("start_btn_start_training", default=TEXTS.get("start_btn_start_training", "🚀 Start Training")), callback_data="start_training")],
-        [InlineKeyboardButton(text=t.get("start_btn_how_it_works", default=TEXTS.get("start_btn_how_it_works", "❓ How it works")), callback_data="how_it_works")],
+        [InlineKeyboardButton(text=t.get("start_btn_start_training"), callback_data="start_training")],
+        [InlineKeyboardButton(text=t.get("start_btn_how_it_works"), callback_data="how_it_works")],
         [InlineKeyboardButton(text=change_lang_text, callback_data="cycle_language")],
     ])
 
 
 def get_onboarding_keyboard(lang: str = "en_US", user_id: int = None, channels: list = None) -> InlineKeyboardMarkup:
     """Onboarding step 2 keyboard - MiniApp as main action."""
-    t = get_texts(lang)
+    if not user_id:
+        # No user context in the MiniApp URL - same keyboard for everyone
+        return _get_default_onboarding_keyboard(lang)
     
     # Build MiniApp URL with user context
-    miniapp_url = settings.miniapp_url
-    if user_id:
-        miniapp_url += f"?user_id={user_id}"
-        if channels:
-            channels_str = ",".join(ch.lstrip("@") for ch in channels)
-            miniapp_url += f"&channels={channels_str}"
+    miniapp_url = settings.miniapp_url + f"?user_id={user_id}"
+    if channels:
+        channels_str = ",".join(ch.lstrip("@") for ch in channels)
+        miniapp_url += f"&channels={channels_str}"
     
-    return InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(
-            text=t.get("onboarding_btn_open_miniapp", default="📱 Обучить в MiniApp"),
-            web_app=WebAppInfo(url=miniapp_url)
-        )],
-        [InlineKeyboardButton(text=t.get("onboarding_btn_rate_in_chat", default="💬 Оценивать в чате"), callback_data="confirm_training")],
-        [InlineKeyboardButton(text=t.get("onboarding_btn_back", default="⬅️ Назад"), callback_data="back_to_start")],
-    ])
+    return _build_onboarding_keyboard(lang, miniapp_url)
 
 
-def get_add_channel_keyboard(lang: str = "en_US") -> InlineKeyboardMarkup:
-    """Add channel step keyboard."""
+@lru_cache(maxsize=32)
+def _get_default_onboarding_keyboard(lang: str) -> InlineKeyboardMarkup:
+    return _build_onboarding_keyboard(lang, settings.miniapp_url)
+
+
+def _build_onboarding_keyboard(lang: str, miniapp_url: str) -> InlineKeyboardMarkup:
     t = get_texts(lang)
     return InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(text=t.get("add_channel_btn_skip_defaults", default="⏭️ Use defaults"), callback_data="skip_add_channel")],
-        [InlineKeyboardButton(text=t.get("add_channel_btn_back", default="⬅️ Back"), callback_data="back_to_onboarding")],
+        [InlineKeyboardButton(
+            text=t.get("onboarding_btn_open_miniapp"),
+            web_app=WebAppInfo(url=miniapp_url)
+        )],
+        [InlineKeyboardButton(text=t.get("onboarding_btn_rate_in_chat"), callback_data="confirm_training")],
+        [InlineKeyboardButton(text=t.get("onboarding_btn_back"), callback_data="back_to_start")],
     ])
 
 
+@lru_cache(maxsize=1024)  # Re-queued posts and retries reuse the same markup
 def get_training_post_keyboard(post_id: int, lang: str = "en_US") -> InlineKeyboardMarkup:
     """Keyboard for rating a training post with progress."""
     t = get_texts(lang)
     buttons = [
         [
-            InlineKeyboardButton(text="👍", callback_data=f"rate:like:{post_id}"),
-            InlineKeyboardButton(text="⏭️", callback_data=f"rate:skip:{post_id}"),
-            InlineKeyboardButton(text="👎", callback_data=f"rate:dislike:{post_id}"),
+            InlineKeyboardButton(text="👍", callback_data=RatePostCallback(action="like", post_id=post_id).pack()),
+            InlineKeyboardButton(text="⏭️", callback_data=RatePostCallback(action="skip", post_id=post_id).pack()),
+            InlineKeyboardButton(text="👎", callback_data=RatePostCallback(action="dislike", post_id=post_id).pack()),
         ],
-        [InlineKeyboardButton(text=t.get("settings_btn_back", default="◀ Back"), callback_data="back_to_start")],
+        [InlineKeyboardButton(text=t.get("settings_btn_back"), callback_data="back_to_start")],
     ]
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
+@lru_cache(maxsize=32)
 def get_miniapp_keyboard(lang: str = "en_US") -> InlineKeyboardMarkup:
     """Keyboard with MiniApp button."""
     t = get_texts(lang)
     return InlineKeyboardMarkup(inline_keyboard=[
         [InlineKeyboardButton(
-            text=t.get("miniapp_btn_open", default="📱 Open MiniApp"),
+            text=t.get("miniapp_btn_open"),
             web_app=WebAppInfo(url=settings.miniapp_url)
         )],
-        [InlineKeyboardButton(text=t.get("miniapp_btn_rate_in_chat", default="💬 Rate in chat"), callback_data="rate_in_chat")],
+        [InlineKeyboardButton(text=t.get("miniapp_btn_rate_in_chat"), callback_data="rate_in_chat")],
     ])
 
 
+@lru_cache(maxsize=32)
 def get_training_complete_keyboard(lang: str = "en_US") -> InlineKeyboardMarkup:
     """Keyboard shown after training is complete."""
     t = get_texts(lang)
     return InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(text=t.get("training_complete_btn_claim_bonus", default="🎁 Claim Bonus Channel"), callback_data="claim_bonus")],
-        [InlineKeyboardButton(text=t.get("training_complete_btn_view_feed", default="📰 View My Feed"), callback_data="view_feed")],
-        [InlineKeyboardButton(text=t.get("settings_btn_my_channels", default="📋 My Channels"), callback_data="my_channels")],
+        [InlineKeyboardButton(text=t.get("training_complete_btn_claim_bonus"), callback_data="claim_bonus")],
+        [InlineKeyboardButton(text=t.get("training_complete_btn_view_feed"), callback_data="view_feed")],
+        [InlineKeyboardButton(text=t.get("settings_btn_my_channels"), callback_data="my_channels")],
     ])
 
 
+@lru_cache(maxsize=32)
 def get_bonus_channel_keyboard(lang: str = "en_US") -> InlineKeyboardMarkup:
     """Keyboard for adding bonus channel."""
     t = get_texts(lang)
     return InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(text=t.get("bonus_btn_add", default="➕ Add Bonus Channel"), callback_data="add_bonus_channel")],
-        [InlineKeyboardButton(text=t.get("bonus_btn_skip", default="⏭️ Skip"), callback_data="skip_bonus")],
+        [InlineKeyboardButton(text=t.get("bonus_btn_add"), callback_data="add_bonus_channel")],
+        [InlineKeyboardButton(text=t.get("bonus_btn_skip"), callback_data="skip_bonus")],
     ])
 
 
+@lru_cache(maxsize=32)
 def get_feed_keyboard(lang: str = "en_US", has_bonus_channel: bool = False) -> InlineKeyboardMarkup:
     """Main feed menu keyboard. Hides add channel button if user already has bonus channel."""
     t = get_texts(lang)
     buttons = []
     if not has_bonus_channel:
-        buttons.append([InlineKeyboardButton(text=t.get("feed_btn_add_channel", default="➕ Add Channel"), callback_data="add_channel_feed")])
-    buttons.append([InlineKeyboardButton(text=t.get("settings_btn_my_channels", default="📋 My Channels"), callback_data="my_channels")])
-    buttons.append([InlineKeyboardButton(text=t.get("feed_btn_settings", default="⚙️ Settings"), callback_data="settings")])
+        buttons.append([InlineKeyboardButton(text=t.get("feed_btn_add_channel"), callback_data="add_channel_feed")])
+    buttons.append([InlineKeyboardButton(text=t.get("settings_btn_my_channels"), callback_data="my_channels")])
+    buttons.append([InlineKeyboardButton(text=t.get("feed_btn_settings"), callback_data="settings")])
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
@@ -165,66 +176,84 @@ def get_feed_post_keyboard(post_id: int, lang: str = "en_US") -> InlineKeyboardM
     t = get_texts(lang)
     return InlineKeyboardMarkup(inline_keyboard=[
         [
-            InlineKeyboardButton(text=t.get("feed_post_btn_like", default="👍"), callback_data=f"feed:like:{post_id}"),
-            InlineKeyboardButton(text=t.get("feed_post_btn_skip", default="⏭"), callback_data=f"feed:skip:{post_id}"),
-            InlineKeyboardButton(text=t.get("feed_post_btn_dislike", default="👎"), callback_data=f"feed:dislike:{post_id}"),
+            InlineKeyboardButton(text=t.get("feed_post_btn_like"), callback_data=FeedPostCallback(action="like", post_id=post_id).pack()),
+            InlineKeyboardButton(text=t.get("feed_post_btn_skip"), callback_data=FeedPostCallback(action="skip", post_id=post_id).pack()),
+            InlineKeyboardButton(text=t.get("feed_post_btn_dislike"), callback_data=FeedPostCallback(action="dislike", post_id=post_id).pack()),
         ],
     ])
 
 
+@lru_cache(maxsize=32)
 def get_settings_keyboard(lang: str = "en_US") -> InlineKeyboardMarkup:
     """Settings menu keyboard."""
     t = get_texts(lang)
     return InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(text=t.get("settings_btn_retrain", default="🔄 Retrain"), callback_data="retrain")],
-        [InlineKeyboardButton(text=t.get("settings_btn_delete_account", default="🗑️ Delete account"), callback_data="delete_account")],
-        [InlineKeyboardButton(text=t.get("settings_btn_language", default="🌐 Language"), callback_data="change_language")],
-        [InlineKeyboardButton(text=t.get("settings_btn_back", default="⬅️ Back"), callback_data="back_to_feed")],
+        [InlineKeyboardButton(text=t.get("settings_btn_retrain"), callback_data="retrain")],
+        [InlineKeyboardButton(text=t.get("settings_btn_delete_account"), callback_data="delete_account")],
+        [InlineKeyboardButton(text=t.get("settings_btn_language"), callback_data="change_language")],
+        [InlineKeyboardButton(text=t.get("settings_btn_back"), callback_data="back_to_feed")],
     ])
 
 
+@lru_cache(maxsize=32)
 def get_confirm_keyboard(action: str, lang: str = "en_US") -> InlineKeyboardMarkup:
     """Generic confirmation keyboard."""
     t = get_texts(lang)
     return InlineKeyboardMarkup(inline_keyboard=[
         [
-            InlineKeyboardButton(text=t.get("confirm_btn_yes", default="✅ Yes"), callback_data=f"confirm:{action}"),
-            InlineKeyboardButton(text=t.get("confirm_btn_no", default="❌ No"), callback_data=f"cancel:{action}"),
+            InlineKeyboardButton(text=t.get("confirm_btn_yes"), callback_data=f"confirm:{action}"),
+            InlineKeyboardButton(text=t.get("confirm_btn_no"), callback_data=f"cancel:{action}"),
         ],
     ])
 
 
+@lru_cache(maxsize=32)
 def get_cancel_keyboard(lang: str = "en_US") -> InlineKeyboardMarkup:
     """Cancel action keyboard."""
     t = get_texts(lang)
     return InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(text=t.get("cancel_btn_cancel", default="❌ Cancel"), callback_data="cancel")],
+        [InlineKeyboardButton(text=t.get("cancel_btn_cancel"), callback_data="cancel")],
     ])
 
 
+@lru_cache(maxsize=32)
 def get_add_channel_keyboard(lang: str = "en_US") -> InlineKeyboardMarkup:
     """Keyboard for add channel prompt with back button."""
     t = get_texts(lang)
     return InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(text=t.get("settings_btn_back", default="⬅️ Назад"), callback_data="back_to_feed")],
+        [InlineKeyboardButton(text=t.get("settings_btn_back"), callback_data="back_to_feed")],
     ])
 
 
+@lru_cache(maxsize=32)
 def get_add_bonus_channel_keyboard(lang: str = "en_US") -> InlineKeyboardMarkup:
     """Keyboard for add bonus channel prompt with back button to bonus offer."""
     t = get_texts(lang)
     return InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(text=t.get("settings_btn_back", default="⬅️ Назад"), callback_data="skip_bonus")],
+        [InlineKeyboardButton(text=t.get("settings_btn_back"), callback_data="skip_bonus")],
     ])
 
 
-def get_channels_view_keyboard(lang: str = "en_US", has_bonus_channel: bool = False) -> InlineKeyboardMarkup:
-    """Keyboard for viewing user's channels with add channel and back to feed buttons."""
+@lru_cache(maxsize=32)
+def get_channels_view_keyboard(
+    lang: str = "en_US",
+    has_bonus_channel: bool = False,
+    page: int = 0,
+    total_pages: int = 1,
+) -> InlineKeyboardMarkup:
+    """Keyboard for viewing user's channels with paging, add channel and back to feed buttons."""
     t = get_texts(lang)
     buttons = []
+    if total_pages > 1:
+        nav = []
+        if page > 0:
+            nav.append(InlineKeyboardButton(text="«", callback_data=f"my_channels:p:{page - 1}"))
+        if page < total_pages - 1:
+            nav.append(InlineKeyboardButton(text="»", callback_data=f"my_channels:p:{page + 1}"))
+        buttons.append(nav)
     if not has_bonus_channel:
-        buttons.append([InlineKeyboardButton(text=t.get("feed_btn_add_channel", default="➕ Add Channel"), callback_data="add_channel_feed")])
-    buttons.append([InlineKeyboardButton(text=t.get("settings_btn_back", default="⬅️ Back"), callback_data="back_to_feed")])
+        buttons.append([InlineKeyboardButton(text=t.get("feed_btn_add_channel"), callback_data="add_channel_feed")])
+    buttons.append([InlineKeyboardButton(text=t.get("settings_btn_back"), callback_data="back_to_feed")])
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
@@ -242,17 +271,34 @@ def get_retrain_keyboard(lang: str = "en_US", user_id: int = None, channels: lis
     
     return InlineKeyboardMarkup(inline_keyboard=[
         [InlineKeyboardButton(
-            text=t.get("retrain_btn_miniapp", default="📱 Переобучить в MiniApp"),
+            text=t.get("retrain_btn_miniapp"),
             web_app=WebAppInfo(url=miniapp_url)
         )],
-        [InlineKeyboardButton(text=t.get("retrain_btn_chat", default="💬 Оценивать в чате"), callback_data="confirm_retrain")],
-        [InlineKeyboardButton(text=t.get("settings_btn_back", default="⬅️ Назад"), callback_data="back_to_settings")],
+        [InlineKeyboardButton(text=t.get("retrain_btn_chat"), callback_data="confirm_retrain")],
+        [InlineKeyboardButton(text=t.get("settings_btn_back"), callback_data="back_to_settings")],
+    ])
+
+
+@lru_cache(maxsize=32)
+def _bonus_training_labels(lang: str) -> tuple[str, str]:
+    t = get_texts(lang)
+    return t.get("miniapp_btn_open"), t.get("miniapp_btn_rate_in_chat")
+
+
+def get_bonus_training_keyboard(lang: str, user_id: int, username: str) -> InlineKeyboardMarkup:
+    """Bonus training choice: rate in MiniApp or in chat."""
+    open_label, rate_label = _bonus_training_labels(lang)
+    url = f"{settings.miniapp_url}?user_id={user_id}&channel={username.lstrip('@')}"
+    return InlineKeyboardMarkup(inline_keyboard=[
+        [InlineKeyboardButton(text=open_label, web_app=WebAppInfo(url=url))],
+        [InlineKeyboardButton(text=rate_label, callback_data=f"confirm_bonus_training:{username}")],
     ])
 
 
+@lru_cache(maxsize=32)
 def get_how_it_works_keyboard(lang: str = "en_US") -> InlineKeyboardMarkup:
     """Keyboard for 'How it works' screen with back button."""
     t = get_texts(lang)
     return InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(text=t.get("onboarding_btn_back", default="⬅️ Назад"), callback_data="back_to_start")],
+        [InlineKeyboardButton(text=t.get("onboarding_btn_back"), callback_data="back_to_start")],
     ])
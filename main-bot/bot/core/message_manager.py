@@ -90,17 +90,9 @@ class MessageManager:
                         return new_message
                     else:
                         # Edit text message
-                        await self.bot.edit_message_text(
-                            text=text,
-                            chat_id=chat_id,
-                            message_id=existing.message_id,
-                            reply_markup=reply_markup,
-                            parse_mode=ParseMode.HTML
-                        )
+                        await self._edit_text(chat_id, existing.message_id, text, reply_markup, existing)
                         return None  # Edited in place
                 except TelegramBadRequest as e:
-                    if "message is not modified" in str(e).lower():
-                        return None  # Same content, no change needed
                     # Error editing, recreate
                     logger.warning(f"Failed to edit system message, recreating: {e}")
                     new_message = await self._send_new_system(
@@ -125,6 +117,7 @@ class MessageManager:
         photo_bytes: Optional[bytes] = None,
         photo_filename: str = "photo.jpg",
         disable_link_preview: bool = False,
+        photo: Optional[str] = None,
     ) -> Optional[Message]:
         """
         Send a TEMPORARY message.
@@ -140,6 +133,14 @@ class MessageManager:
                     reply_markup=reply_markup,
                     parse_mode=ParseMode.HTML
                 )
+            elif photo:
+                message = await self.bot.send_photo(
+                    chat_id=chat_id,
+                    photo=photo,
+                    caption=text,
+                    reply_markup=reply_markup,
+                    parse_mode=ParseMode.HTML
+                )
             else:
                 message = await self.bot.send_message(
                     chat_id=chat_id,
@@ -153,7 +154,8 @@ class MessageManager:
                 message_id=message.message_id,
                 chat_id=chat_id,
                 message_type=MessageType.EPHEMERAL,
-                tag=tag
+                tag=tag,
+                rendered=None if (photo or photo_bytes) else (text, reply_markup)
             )
             await self.registry.register(managed)
             
@@ -262,24 +264,14 @@ class MessageManager:
                 deleted_count = 1
         else:
             messages = await self.registry.get_messages(chat_id, MessageType.EPHEMERAL, tag)
-            for msg in messages:
-                if await self._delete_message(chat_id, msg.message_id):
-                    await self.registry.remove(chat_id, msg.message_id)
-                    deleted_count += 1
+            deleted_count = await self._delete_registered(chat_id, messages)
         
         return deleted_count
     
     async def delete_system(self, chat_id: int, tag: Optional[str] = None) -> int:
         """Delete system message(s) by tag or all if no tag."""
-        deleted_count = 0
         messages = await self.registry.get_messages(chat_id, MessageType.SYSTEM, tag)
-        
-        for msg in messages:
-            if await self._delete_message(chat_id, msg.message_id):
-                await self.registry.remove(chat_id, msg.message_id)
-                deleted_count += 1
-        
-        return deleted_count
+        return await self._delete_registered(chat_id, messages)
     
     async def delete_user_message(self, message: Message) -> bool:
         """
@@ -323,10 +315,7 @@ class MessageManager:
         
         if include_regular:
             messages = await self.registry.get_messages(chat_id, MessageType.REGULAR)
-            for msg in messages:
-                if await self._delete_message(chat_id, msg.message_id):
-                    await self.registry.remove(chat_id, msg.message_id)
-                    result["regular"] += 1
+            result["regular"] = await self._delete_registered(chat_id, messages)
         
         return result
     
@@ -373,17 +362,9 @@ class MessageManager:
         
         # Try to edit existing
         try:
-            await self.bot.edit_message_text(
-                text=text,
-                chat_id=chat_id,
-                message_id=existing.message_id,
-                reply_markup=reply_markup,
-                parse_mode=ParseMode.HTML
-            )
+            await self._edit_text(chat_id, existing.message_id, text, reply_markup, existing)
             return True
         except TelegramBadRequest as e:
-            if "message is not modified" in str(e).lower():
-                return True  # Same content, considered success
             # Error editing, recreate
             logger.warning(f"Failed to edit system message, recreating: {e}")
             new_message = await self._send_new_system(
@@ -395,6 +376,73 @@ class MessageManager:
                 return True
             return False
     
+    async def edit_message(
+        self,
+        message: Message,
+        text: str,
+        reply_markup: Optional[InlineKeyboardMarkup] = None
+    ) -> None:
+        """
+        Edit a text message in place (e.g. the one whose button was pressed).
+        
+        Skips the API call if a tracked message already shows this text and keyboard.
+        Raises TelegramBadRequest like Message.edit_text.
+        """
+        managed = await self.registry.get(message.chat.id, message.message_id)
+        await self._edit_text(message.chat.id, message.message_id, text, reply_markup, managed)
+    
+    async def show_menu(
+        self,
+        chat_id: int,
+        text: str,
+        reply_markup: Optional[InlineKeyboardMarkup] = None,
+        tag: str = "menu"
+    ) -> None:
+        """
+        Show a menu screen: edit the system message with given tag,
+        or send a new one if there is nothing to edit.
+        """
+        if not await self.edit_system(chat_id, text, reply_markup=reply_markup, tag=tag):
+            await self.send_system(chat_id, text, reply_markup=reply_markup, tag=tag)
+    
+    async def replace_temporary(
+        self,
+        chat_id: int,
+        tag: str,
+        text: str,
+        reply_markup: Optional[InlineKeyboardMarkup] = None,
+        auto_delete_after: Optional[float] = None,
+        new_tag: Optional[str] = None
+    ) -> bool:
+        """
+        Replace the latest temporary message with given tag by new text.
+        
+        Edits the message in place (one API call instead of delete + send).
+        Falls back to delete + send_temporary if there is nothing to edit.
+        """
+        existing = await self.registry.get_latest(chat_id, MessageType.EPHEMERAL, tag)
+        if existing:
+            try:
+                await self._edit_text(chat_id, existing.message_id, text, reply_markup, existing)
+                existing.tag = new_tag
+                if auto_delete_after:
+                    asyncio.create_task(
+                        self._auto_delete(chat_id, existing.message_id, auto_delete_after)
+                    )
+                return True
+            except TelegramBadRequest as e:
+                logger.debug(f"Failed to edit temporary message, resending: {e}")
+                await self.delete_temporary(chat_id, existing.message_id)
+        
+        message = await self.send_temporary(
+            chat_id,
+            text,
+            reply_markup=reply_markup,
+            tag=new_tag,
+            auto_delete_after=auto_delete_after
+        )
+        return message is not None
+    
     async def edit_reply_markup(
         self,
         chat_id: int,
@@ -402,18 +450,25 @@ class MessageManager:
         reply_markup: Optional[InlineKeyboardMarkup] = None
     ) -> bool:
         """Edit reply markup of any tracked message."""
+        managed = await self.registry.get(chat_id, message_id)
+        rendered = managed.rendered if managed is not None else None
+        if rendered is not None and rendered[1] == reply_markup:
+            return True
         try:
             await self.bot.edit_message_reply_markup(
                 chat_id=chat_id,
                 message_id=message_id,
                 reply_markup=reply_markup
             )
-            return True
         except TelegramBadRequest as e:
-            if "message is not modified" in str(e).lower():
-                return True
-            logger.error(f"Failed to edit reply markup: {e}")
-            return False
+            if "message is not modified" not in str(e).lower():
+                logger.error(f"Failed to edit reply markup: {e}")
+                if managed is not None:
+                    managed.rendered = None
+                return False
+        if rendered is not None:
+            managed.rendered = (rendered[0], reply_markup)
+        return True
     
     # ============== Helper Methods ==============
     
@@ -516,7 +571,8 @@ class MessageManager:
                 message_id=message.message_id,
                 chat_id=chat_id,
                 message_type=MessageType.SYSTEM,
-                tag=tag
+                tag=tag,
+                rendered=None if (photo or photo_bytes) else (text, reply_markup)
             )
             await self.registry.register(managed)
             return message
@@ -524,6 +580,34 @@ class MessageManager:
             logger.error(f"Failed to send new system message: {e}")
             return None
     
+    async def _edit_text(
+        self,
+        chat_id: int,
+        message_id: int,
+        text: str,
+        reply_markup: Optional[InlineKeyboardMarkup],
+        managed: Optional[ManagedMessage] = None
+    ) -> None:
+        """Edit message text, skipping the call if `managed` already shows this content."""
+        content = (text, reply_markup)
+        if managed is not None and managed.rendered == content:
+            return
+        try:
+            await self.bot.edit_message_text(
+                text=text,
+                chat_id=chat_id,
+                message_id=message_id,
+                reply_markup=reply_markup,
+                parse_mode=ParseMode.HTML
+            )
+        except TelegramBadRequest as e:
+            if "message is not modified" not in str(e).lower():
+                if managed is not None:
+                    managed.rendered = None
+                raise
+        if managed is not None:
+            managed.rendered = content
+    
     async def _delete_message(self, chat_id: int, message_id: int) -> bool:
         """Safely delete a message, handling errors gracefully."""
         try:
@@ -541,6 +625,17 @@ class MessageManager:
             logger.error(f"Unexpected error deleting message {message_id}: {e}")
             return False
     
+    async def _delete_registered(self, chat_id: int, messages: List[ManagedMessage]) -> int:
+        """Delete registered messages concurrently and drop them from the registry."""
+        async def delete_one(msg: ManagedMessage) -> bool:
+            if await self._delete_message(chat_id, msg.message_id):
+                await self.registry.remove(chat_id, msg.message_id)
+                return True
+            return False
+        
+        results = await asyncio.gather(*(delete_one(msg) for msg in messages))
+        return sum(results)
+    
     async def _auto_delete(self, chat_id: int, message_id: int, delay: float) -> None:
         """Auto-delete a message after delay."""
         await asyncio.sleep(delay)
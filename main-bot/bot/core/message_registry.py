@@ -6,7 +6,7 @@ Thread-safe registry implementation using asyncio.Lock.
 
 import asyncio
 from enum import Enum
-from typing import Optional, Dict, List
+from typing import Any, Optional, Dict, List, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -18,7 +18,7 @@ class MessageType(Enum):
     REGULAR = "regular"    # Regular messages (posts), kept forever
 
 
-@dataclass
+@dataclass(slots=True)
 class ManagedMessage:
     """Represents a message managed by MessageManager."""
     message_id: int
@@ -26,6 +26,8 @@ class ManagedMessage:
     message_type: MessageType
     created_at: datetime = field(default_factory=datetime.utcnow)
     tag: Optional[str] = None  # Optional tag for grouping (e.g., "menu", "training_post")
+    # (text, reply_markup) a text message currently shows, so identical edits can be skipped
+    rendered: Optional[Tuple[str, Any]] = None
 
 
 class MessageRegistry:
@@ -70,6 +72,15 @@ class MessageRegistry:
         messages = await self.get_messages(chat_id, message_type, tag)
         return messages[-1] if messages else None
     
+    async def get(self, chat_id: int, message_id: int) -> Optional[ManagedMessage]:
+        """Get a tracked message by ID."""
+        async with self._lock:
+            for msgs in self._registry.get(chat_id, {}).values():
+                for msg in msgs:
+                    if msg.message_id == message_id:
+                        return msg
+            return None
+    
     async def remove(self, chat_id: int, message_id: int) -> bool:
         """Remove a message from registry."""
         async with self._lock:
@@ -1,11 +1,18 @@
 """Middleware for bot handlers."""
 
+import asyncio
 import logging
+from collections import OrderedDict
 from typing import Callable, Dict, Any, Awaitable
-from aiogram import BaseMiddleware
+from aiogram import BaseMiddleware, Bot
+from aiogram.client.session.middlewares.base import BaseRequestMiddleware, NextRequestMiddlewareType
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import AnswerCallbackQuery, CopyMessage, ForwardMessage, SendChatAction, TelegramMethod
+from aiogram.methods.base import Response, TelegramType
 from aiogram.types import TelegramObject, Message, Update
 
 from bot.core.message_manager import MessageManager
+from bot.utils import TokenBucket
 
 logger = logging.getLogger(__name__)
 
@@ -70,3 +77,71 @@ class AutoDeleteUserMessagesMiddleware(BaseMiddleware):
         
         return result
 
+
+
+class RateLimitRequestMiddleware(BaseRequestMiddleware):
+    """Session middleware that paces outgoing Bot API calls.
+    
+    All calls share a global bucket sized to Telegram's ~30 msg/s bot
+    limit, and calls that post a new message to a chat (send/copy/forward)
+    also take a token from that chat's bucket. Its burst fits a whole feed
+    render (menu plus a few posts with their button messages), so only
+    sustained sending such as broadcasts is slowed to the per-chat rate.
+    Deletes, edits, reactions and chat actions only use the global bucket.
+    Callers simply await longer under load instead of collecting 429s;
+    a 429 that still slips through is retried once after the delay
+    Telegram asks for.
+    """
+    
+    # Callback answers don't count against message limits and must be fast
+    _UNLIMITED = (AnswerCallbackQuery,)
+    # Telegram's per-chat limit is about new messages, so only these are paced per chat
+    _PER_CHAT = (CopyMessage, ForwardMessage)
+    
+    @classmethod
+    def _posts_message(cls, method: TelegramMethod) -> bool:
+        if isinstance(method, SendChatAction):
+            return False
+        return isinstance(method, cls._PER_CHAT) or type(method).__name__.startswith("Send")
+    
+    def __init__(
+        self,
+        global_rate: float = 30.0,
+        chat_rate: float = 1.0,
+        chat_burst: float = 20.0,
+        max_chats: int = 10000,
+    ):
+        self._global = TokenBucket(global_rate, global_rate)
+        self._chat_rate = chat_rate
+        self._chat_burst = chat_burst
+        self._max_chats = max_chats
+        self._chats: OrderedDict[int | str, TokenBucket] = OrderedDict()
+    
+    def _chat_bucket(self, chat_id: int | str) -> TokenBucket:
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            bucket = TokenBucket(self._chat_rate, self._chat_burst)
+            self._chats[chat_id] = bucket
+            while len(self._chats) > self._max_chats:
+                self._chats.popitem(last=False)
+        else:
+            self._chats.move_to_end(chat_id)
+        return bucket
+    
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        if not isinstance(method, self._UNLIMITED):
+            chat_id = getattr(method, "chat_id", None)
+            if chat_id is not None and self._posts_message(method):
+                await self._chat_bucket(chat_id).acquire()
+            await self._global.acquire()
+        try:
+            return await make_request(bot, method)
+        except TelegramRetryAfter as e:
+            logger.warning("Rate limited on %s, retrying in %ss", type(method).__name__, e.retry_after)
+            await asyncio.sleep(e.retry_after)
+            return await make_request(bot, method)
@@ -0,0 +1,143 @@
+"""
+Redis-backed delayed jobs.
+
+Jobs live in a Redis sorted set scored by their due time, so they survive
+bot restarts and cost no memory in the bot process while they wait.
+A single poller claims due jobs with ZREM (only one bot instance wins a job)
+and dispatches them to the handler registered for the job type.
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from typing import Callable, Awaitable, Optional
+
+import redis.asyncio as aioredis
+
+from bot.core.config import get_settings
+from bot.utils import fire_and_forget
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+JOBS_KEY = "ppp:main_bot:delayed_jobs"
+
+
+class DelayedJobScheduler:
+    """Schedule jobs to run after a delay and dispatch them when due."""
+
+    def __init__(self, redis_url: str, poll_interval: float = 1.0, batch_size: int = 100):
+        self.redis_url = redis_url
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self._redis: Optional[aioredis.Redis] = None
+        self._running = False
+        self._task: Optional[asyncio.Task] = None
+        self._handlers: dict[str, Callable[[dict], Awaitable[None]]] = {}
+
+    def _get_redis(self) -> aioredis.Redis:
+        if self._redis is None:
+            self._redis = aioredis.from_url(
+                self.redis_url,
+                decode_responses=True,
+                socket_connect_timeout=5,
+                socket_timeout=5,
+            )
+        return self._redis
+
+    def register_handler(self, job_type: str, handler: Callable[[dict], Awaitable[None]]):
+        """Register a handler for a job type."""
+        self._handlers[job_type] = handler
+        logger.info("Registered delayed job handler: %s", job_type)
+
+    async def schedule(self, job_type: str, payload: dict, delay: float) -> None:
+        """Run the handler for job_type with payload after `delay` seconds."""
+        job = json.dumps({"id": uuid.uuid4().hex, "type": job_type, "payload": payload})
+        try:
+            await self._get_redis().zadd(JOBS_KEY, {job: time.time() + delay})
+        except Exception as e:
+            # Don't lose the job if Redis is down - keep it in this process instead
+            logger.warning("Failed to persist delayed job %s, running it in-process: %s", job_type, e)
+            fire_and_forget(self._run_later(job_type, payload, delay))
+
+    async def _run_later(self, job_type: str, payload: dict, delay: float) -> None:
+        await asyncio.sleep(delay)
+        await self._dispatch(job_type, payload)
+
+    async def start(self):
+        """Start polling for due jobs."""
+        if self._running:
+            return
+
+        self._running = True
+        self._task = asyncio.create_task(self._poll_loop())
+        logger.info("Delayed job scheduler started")
+
+    async def stop(self):
+        """Stop polling; pending jobs stay in Redis for the next start."""
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+        if self._redis:
+            await self._redis.close()
+            self._redis = None
+
+        logger.info("Delayed job scheduler stopped")
+
+    async def _poll_loop(self):
+        """Claim and dispatch due jobs until stopped."""
+        while self._running:
+            try:
+                claimed = await self._claim_due_jobs()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error("Delayed job poll error: %s", e)
+                claimed = 0
+            # Drain a backlog without waiting, otherwise idle until the next tick
+            if claimed < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
+
+    async def _claim_due_jobs(self) -> int:
+        redis_client = self._get_redis()
+        due = await redis_client.zrangebyscore(
+            JOBS_KEY, "-inf", time.time(), start=0, num=self.batch_size
+        )
+        for raw in due:
+            # ZREM is atomic: only the instance that removes the job runs it
+            if not await redis_client.zrem(JOBS_KEY, raw):
+                continue
+            try:
+                job = json.loads(raw)
+            except json.JSONDecodeError:
+                logger.error("Invalid delayed job: %s", raw)
+                continue
+            fire_and_forget(self._dispatch(job.get("type"), job.get("payload") or {}))
+        return len(due)
+
+    async def _dispatch(self, job_type: str, payload: dict) -> None:
+        handler = self._handlers.get(job_type)
+        if handler is None:
+            logger.warning("No handler for delayed job %s", job_type)
+            return
+        try:
+            await handler(payload)
+        except Exception as e:
+            logger.error("Delayed job %s failed: %s", job_type, e, exc_info=True)
+
+
+_scheduler: Optional[DelayedJobScheduler] = None
+
+
+def get_delayed_jobs() -> DelayedJobScheduler:
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = DelayedJobScheduler(settings.redis_url)
+    return _scheduler
@@ -11,8 +11,9 @@ from aiogram.filters import CommandStart, Command
 from bot.core import (
     MessageManager, get_texts,
     get_start_keyboard, get_feed_keyboard, get_settings_keyboard,
-    get_language_selection_keyboard,
+    get_language_selection_keyboard, get_confirm_keyboard,
 )
+from bot.core.keyboards import get_next_language, get_language_flag
 from bot.services import get_core_api
 
 logger = logging.getLogger(__name__)
@@ -26,7 +27,7 @@ async def get_user_texts(user_id: int):
     return get_texts(lang)
 
 
-from bot.utils import get_user_lang as _get_user_lang
+from bot.utils import get_user_lang as _get_user_lang, single_flight, fire_and_forget
 
 
 @router.message(CommandStart())
@@ -47,7 +48,7 @@ async def cmd_start(message: Message, message_manager: MessageManager):
     
     # Log activity
     await api.update_activity(user.id)
-    await api.create_log(user.id, "command_start")
+    fire_and_forget(api.create_log(user.id, "command_start"))
     
     if not user_data:
         lang = await api.get_user_language(user.id)
@@ -63,8 +64,8 @@ async def cmd_start(message: Message, message_manager: MessageManager):
     # Delete user's /start command message to keep chat clean
     await message_manager.delete_user_message(message)
     
-    # Get user's language preference
-    lang = await api.get_user_language(user.id)
+    # The user row already carries the language; only re-fetch if it's missing
+    lang = user_data.get("language") or await api.get_user_language(user.id)
     texts = get_texts(lang)
     
     # Check user status and route accordingly
@@ -181,16 +182,16 @@ async def on_delete_account(
     await message_manager.send_toast(callback)
     lang = await _get_user_lang(callback.from_user.id)
     texts = get_texts(lang)
-    from bot.core import get_confirm_keyboard
     await message_manager.send_temporary(
         callback.message.chat.id,
-        texts.get("delete_account_confirm", default="Are you sure you want to delete your account? This cannot be undone."),
+        texts.get("delete_account_confirm"),
         reply_markup=get_confirm_keyboard("delete_account", lang),
         tag="delete_account_confirm"
     )
 
 
 @router.callback_query(F.data == "confirm:delete_account")
+@single_flight
 async def on_confirm_delete_account(
     callback: CallbackQuery,
     message_manager: MessageManager
@@ -224,14 +225,14 @@ async def on_cancel_delete_account(
     """Cancel account deletion."""
     lang = await _get_user_lang(callback.from_user.id)
     texts = get_texts(lang)
-    await message_manager.send_toast(callback, texts.get("cancelled", default="Cancelled"))
+    await message_manager.send_toast(callback, texts.get("cancelled"))
     await message_manager.delete_temporary(callback.message.chat.id, tag="delete_account_confirm")
 
 
 @router.callback_query(F.data == "cycle_language")
+@single_flight
 async def on_cycle_language(callback: CallbackQuery, message_manager: MessageManager):
     """Cycle to next language from SUPPORTED_LANGUAGES."""
-    from bot.core.keyboards import get_next_language, get_language_flag
     
     api = get_core_api()
     user_id = callback.from_user.id
@@ -251,9 +252,8 @@ async def on_cycle_language(callback: CallbackQuery, message_manager: MessageMan
     
     # Show toast with language name
     next_flag = get_language_flag(next_lang)
-    # Get language name from its own language file
-    next_lang_texts = get_texts(next_lang)
-    lang_name = next_lang_texts.get(f"lang_name_{next_lang}", next_lang)
+    # Language name comes from its own language file
+    lang_name = texts.get(f"lang_name_{next_lang}", next_lang)
     await message_manager.send_toast(callback, f"{next_flag} {lang_name}")
     
     # Update system message
@@ -277,20 +277,21 @@ async def on_change_language(callback: CallbackQuery, message_manager: MessageMa
     # Send temporary message with language selection
     await message_manager.send_temporary(
         callback.message.chat.id,
-        texts.get("language_selection_title", default="🌐 Select language / Выберите язык:"),
+        texts.get("language_selection_title"),
         reply_markup=get_language_selection_keyboard(lang),
         tag="language_selection"
     )
 
 
 @router.callback_query(F.data.startswith("select_language:"))
+@single_flight
 async def on_select_language(callback: CallbackQuery, message_manager: MessageManager):
     """Handle language selection from temporary message."""
     api = get_core_api()
     user_id = callback.from_user.id
     
     # Extract language from callback data
-    selected_lang = callback.data.split(":")[1]
+    selected_lang = callback.data.partition(":")[2]
     
     # Save language preference
     await api.set_user_language(user_id, selected_lang)
@@ -299,11 +300,9 @@ async def on_select_language(callback: CallbackQuery, message_manager: MessageMa
     texts = get_texts(selected_lang)
     
     # Show toast with language name
-    from bot.core.keyboards import get_language_flag
     flag = get_language_flag(selected_lang)
-    # Get language name from its own language file
-    selected_lang_texts = get_texts(selected_lang)
-    lang_name = selected_lang_texts.get(f"lang_name_{selected_lang}", selected_lang)
+    # Language name comes from its own language file
+    lang_name = texts.get(f"lang_name_{selected_lang}", selected_lang)
     await message_manager.send_toast(callback, f"{flag} {lang_name}")
     
     # Delete temporary language selection message
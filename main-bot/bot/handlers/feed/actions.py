@@ -1,15 +1,18 @@
 """Feed action handlers (bonus channels, settings, channels management)."""
 
+import asyncio
 import logging
+from functools import lru_cache
 
 from aiogram import Router, F
-from aiogram.types import CallbackQuery, Message
+from aiogram.types import CallbackQuery, Message, User, InlineKeyboardMarkup
 from aiogram.fsm.context import FSMContext
 
 from bot.core import (
     MessageManager, get_texts,
     get_feed_keyboard, get_bonus_channel_keyboard,
     get_settings_keyboard, get_add_channel_keyboard,
+    get_channels_view_keyboard, get_onboarding_keyboard, get_start_keyboard,
 )
 from bot.core.states import FeedStates
 from bot.services import get_core_api, get_user_bot
@@ -19,8 +22,31 @@ from bot.handlers.training.retrain import start_full_retrain, start_bonus_traini
 logger = logging.getLogger(__name__)
 router = Router()
 
+# Channels listed per page on the "My Channels" screen
+_CHANNELS_PAGE_SIZE = 10
 
-from bot.utils import get_user_lang as _get_user_lang
+
+from bot.utils import (
+    get_user_lang as _get_user_lang, single_flight, fire_and_forget, parse_channel_username,
+)
+
+
+@lru_cache(maxsize=32)
+def _settings_menu(lang: str) -> tuple[str, InlineKeyboardMarkup]:
+    """Settings screen text and keyboard (static per language)."""
+    return get_texts(lang).get("settings_title"), get_settings_keyboard(lang)
+
+
+@lru_cache(maxsize=64)
+def _feed_menu(lang: str, has_bonus: bool) -> tuple[str, InlineKeyboardMarkup]:
+    """Feed-ready screen text and keyboard (static per language and bonus flag)."""
+    return get_texts(lang).get("feed_ready"), get_feed_keyboard(lang, has_bonus_channel=has_bonus)
+
+
+async def _feed_ready_menu(user_id: int) -> tuple[str, InlineKeyboardMarkup]:
+    """Feed-ready screen for a user, resolved from their feed context."""
+    context = await get_core_api().get_feed_context(user_id)
+    return _feed_menu(context["lang"], context["has_bonus"])
 
 
 @router.callback_query(F.data == "claim_bonus")
@@ -29,16 +55,16 @@ async def on_claim_bonus(
     message_manager: MessageManager
 ):
     """Show bonus channel claim option."""
-    await message_manager.send_toast(callback)
+    fire_and_forget(message_manager.send_toast(callback))
     api = get_core_api()
     user_id = callback.from_user.id
     
-    await api.update_activity(user_id)
-    user_data = await api.get_user(user_id)
-    lang = await _get_user_lang(user_id)
+    fire_and_forget(api.update_activity(user_id))
+    context = await api.get_feed_context(user_id)
+    lang = context["lang"]
     texts = get_texts(lang)
     
-    if user_data and user_data.get("bonus_channels_count", 0) >= 1:
+    if context["has_bonus"]:
         await message_manager.send_temporary(
             callback.message.chat.id,
             texts.get("already_have_bonus"),
@@ -55,13 +81,14 @@ async def on_claim_bonus(
 
 
 @router.callback_query(F.data == "retrain")
+@single_flight
 async def on_retrain_model(
     callback: CallbackQuery,
     message_manager: MessageManager,
     state: FSMContext,
 ):
     """Start a new interactive retraining session on user's channels."""
-    await message_manager.send_toast(callback)
+    fire_and_forget(message_manager.send_toast(callback))
 
     await start_full_retrain(
         chat_id=callback.message.chat.id,
@@ -78,7 +105,7 @@ async def on_add_bonus_channel(
     state: FSMContext
 ):
     """Prompt for bonus channel."""
-    await message_manager.send_toast(callback)
+    fire_and_forget(message_manager.send_toast(callback))
     
     api = get_core_api()
     user_id = callback.from_user.id
@@ -87,60 +114,92 @@ async def on_add_bonus_channel(
     
     await state.set_state(FeedStates.adding_bonus_channel)
     
-    # Use edit_system to ensure temporary messages are deleted
-    success = await message_manager.edit_system(
+    await message_manager.show_menu(
         callback.message.chat.id,
         texts.get("add_channel_prompt"),
-        reply_markup=get_add_channel_keyboard(lang),
-        tag="menu"
+        reply_markup=get_add_channel_keyboard(lang)
     )
-    if not success:
-        # Fallback to send_system if edit fails
-        await message_manager.send_system(
-            callback.message.chat.id,
-            texts.get("add_channel_prompt"),
-            reply_markup=get_add_channel_keyboard(lang),
-            tag="menu"
-        )
 
 
-@router.message(FeedStates.adding_bonus_channel)
-async def on_bonus_channel_input(
+# Registering the bonus channel is retried with these pauses before giving up
+_POST_JOIN_RETRY_DELAYS = (1.0, 3.0)
+
+
+async def _post_join_work(
+    chat_id: int,
+    user_id: int,
+    username: str,
+    user_obj: User,
+    user_exists: bool,
+    message_manager: MessageManager,
+    lang: str,
+):
+    """Register a freshly joined bonus channel for the user, telling them if it fails.
+    
+    The channel scrape is not started here: start_bonus_training already runs it.
+    """
+    api = get_core_api()
+    # Each step is retried only until it succeeds once
+    channel_added = False
+    for delay in (*_POST_JOIN_RETRY_DELAYS, None):
+        try:
+            if not user_exists:
+                user_exists = await api.get_or_create_user(
+                    telegram_id=user_id,
+                    username=user_obj.username,
+                    first_name=user_obj.first_name,
+                    last_name=user_obj.last_name,
+                    language_code=user_obj.language_code
+                ) is not None
+            if user_exists and not channel_added:
+                channel_added = await api.add_user_channel(user_id, username, is_bonus=True)
+            if channel_added and await api.update_user(user_id, bonus_channels_count=1) is not None:
+                fire_and_forget(api.create_log(user_id, "bonus_channel_claimed", username))
+                return
+        except Exception as e:
+            logger.warning("Post-join work failed for %s (user %s): %s", username, user_id, e)
+        if delay is not None:
+            await asyncio.sleep(delay)
+    
+    logger.error("Giving up registering bonus channel %s for user %s", username, user_id)
+    await message_manager.send_temporary(
+        chat_id,
+        get_texts(lang).get("bonus_channel_save_failed", username=username),
+        auto_delete_after=10.0
+    )
+
+
+async def _add_channel_flow(
     message: Message,
     message_manager: MessageManager,
     state: FSMContext
 ):
-    """Handle bonus channel input."""
+    """Shared flow for adding the user's bonus channel from chat input."""
     channel_input = message.text.strip()
-    try:
-        await message.delete()
-    except Exception:
-        pass
+    await message_manager.delete_user_message(message)
     
     api = get_core_api()
     user_bot = get_user_bot()
     user_id = message.from_user.id
     
-    await api.update_activity(user_id)
-    lang = await _get_user_lang(user_id)
+    fire_and_forget(api.update_activity(user_id))
+    context = await api.get_feed_context(user_id)
+    lang = context["lang"]
     texts = get_texts(lang)
     
-    user_data = await api.get_user(user_id)
-    if user_data and user_data.get("bonus_channels_count", 0) >= 1:
+    if context["has_bonus"]:
         await state.clear()
+        text, keyboard = _feed_menu(lang, True)
         await message_manager.send_system(
             message.chat.id,
-            texts.get("feed_ready"),
-            reply_markup=get_feed_keyboard(lang, has_bonus_channel=True),
+            text,
+            reply_markup=keyboard,
             tag="menu"
         )
         return
     
-    if channel_input.startswith("https://t.me/"):
-        username = "@" + channel_input.split("/")[-1]
-    elif channel_input.startswith("@"):
-        username = channel_input
-    else:
+    username = parse_channel_username(channel_input)
+    if not username:
         await message_manager.send_temporary(
             message.chat.id,
             texts.get("invalid_channel_username_short"),
@@ -157,21 +216,11 @@ async def on_bonus_channel_input(
     join_result = await user_bot.join_channel(username)
     
     if join_result and join_result.get("success"):
-        await user_bot.scrape_channel(username, limit=10)
-        
-        user_obj = message.from_user
-        await api.get_or_create_user(
-            telegram_id=user_id,
-            username=user_obj.username,
-            first_name=user_obj.first_name,
-            last_name=user_obj.last_name,
-            language_code=user_obj.language_code
-        )
-        
-        add_result = await api.add_user_channel(user_id, username, is_bonus=True)
-        if add_result:
-            await api.update_user(user_id, bonus_channels_count=1)
-            await api.create_log(user_id, "bonus_channel_claimed", username)
+        # Scraping and DB writes run in background so the UI responds immediately
+        fire_and_forget(_post_join_work(
+            message.chat.id, user_id, username, message.from_user,
+            user_exists=context["exists"], message_manager=message_manager, lang=lang,
+        ))
         
         await state.clear()
         await message_manager.delete_temporary(message.chat.id, tag="loading")
@@ -184,15 +233,26 @@ async def on_bonus_channel_input(
             state=state,
         )
     else:
-        await message_manager.delete_temporary(message.chat.id, tag="loading")
-        await message_manager.send_temporary(
+        await message_manager.replace_temporary(
             message.chat.id,
+            "loading",
             texts.get("cannot_access_channel", username=username),
             auto_delete_after=5.0
         )
 
 
+@router.message(FeedStates.adding_bonus_channel)
+async def on_bonus_channel_input(
+    message: Message,
+    message_manager: MessageManager,
+    state: FSMContext
+):
+    """Handle bonus channel input."""
+    await _add_channel_flow(message, message_manager, state)
+
+
 @router.callback_query(F.data == "skip_bonus")
+@single_flight
 async def on_skip_bonus(
     callback: CallbackQuery,
     message_manager: MessageManager
@@ -201,12 +261,13 @@ async def on_skip_bonus(
     lang = await _get_user_lang(callback.from_user.id)
     texts = get_texts(lang)
     
-    await message_manager.send_toast(callback, texts.get("you_can_claim_later"))
+    fire_and_forget(message_manager.send_toast(callback, texts.get("you_can_claim_later")))
     
+    text, keyboard = _feed_menu(lang, False)
     await message_manager.send_system(
         callback.message.chat.id,
-        texts.get("feed_ready"),
-        reply_markup=get_feed_keyboard(lang, has_bonus_channel=False),
+        text,
+        reply_markup=keyboard,
         tag="menu"
     )
 
@@ -218,41 +279,32 @@ async def on_add_channel_feed(
     state: FSMContext
 ):
     """Add a new channel from feed menu."""
-    await message_manager.send_toast(callback)
+    fire_and_forget(message_manager.send_toast(callback))
     
     api = get_core_api()
-    user_id = callback.from_user.id
-    lang = await _get_user_lang(user_id)
-    texts = get_texts(lang)
+    context = await api.get_feed_context(callback.from_user.id)
+    lang = context["lang"]
     
-    user_data = await api.get_user(user_id)
-    if user_data and user_data.get("bonus_channels_count", 0) >= 1:
+    if context["has_bonus"]:
+        text, keyboard = _feed_menu(lang, True)
         await message_manager.send_system(
             callback.message.chat.id,
-            texts.get("feed_ready"),
-            reply_markup=get_feed_keyboard(lang, has_bonus_channel=True),
+            text,
+            reply_markup=keyboard,
             tag="menu"
         )
         return
     
+    texts = get_texts(lang)
+    
     await state.set_state(FeedStates.adding_channel)
     await message_manager.delete_temporary(callback.message.chat.id, tag="bonus_nudge")
     
-    # Use edit_system to ensure temporary messages are deleted
-    success = await message_manager.edit_system(
+    await message_manager.show_menu(
         callback.message.chat.id,
         texts.get("add_channel_prompt"),
-        reply_markup=get_add_channel_keyboard(lang),
-        tag="menu"
+        reply_markup=get_add_channel_keyboard(lang)
     )
-    if not success:
-        # Fallback to send_system if edit fails
-        await message_manager.send_system(
-            callback.message.chat.id,
-            texts.get("add_channel_prompt"),
-            reply_markup=get_add_channel_keyboard(lang),
-            tag="menu"
-        )
 
 
 @router.message(FeedStates.adding_channel)
@@ -262,211 +314,113 @@ async def on_channel_feed_input(
     state: FSMContext
 ):
     """Handle channel input from feed menu - same as bonus channel flow."""
-    channel_input = message.text.strip()
-    await message_manager.delete_user_message(message)
-    
-    api = get_core_api()
-    user_bot = get_user_bot()
-    user_id = message.from_user.id
-    
-    await api.update_activity(user_id)
-    lang = await _get_user_lang(user_id)
-    texts = get_texts(lang)
-    
-    user_data = await api.get_user(user_id)
-    if user_data and user_data.get("bonus_channels_count", 0) >= 1:
-        await state.clear()
-        await message_manager.send_system(
-            message.chat.id,
-            texts.get("feed_ready"),
-            reply_markup=get_feed_keyboard(lang, has_bonus_channel=True),
-            tag="menu"
-        )
-        return
-    
-    if channel_input.startswith("https://t.me/"):
-        username = "@" + channel_input.split("/")[-1]
-    elif channel_input.startswith("@"):
-        username = channel_input
-    else:
-        await message_manager.send_temporary(
-            message.chat.id,
-            texts.get("invalid_channel_username_short"),
-            auto_delete_after=5.0
-        )
-        return
-    
-    await message_manager.send_temporary(
-        message.chat.id,
-        texts.get("adding_bonus_channel", username=username),
-        tag="loading"
-    )
-    
-    join_result = await user_bot.join_channel(username)
-    
-    if join_result and join_result.get("success"):
-        await user_bot.scrape_channel(username, limit=10)
-        
-        user_obj = message.from_user
-        await api.get_or_create_user(
-            telegram_id=user_id,
-            username=user_obj.username,
-            first_name=user_obj.first_name,
-            last_name=user_obj.last_name,
-            language_code=user_obj.language_code
-        )
-        
-        add_result = await api.add_user_channel(user_id, username, is_bonus=True)
-        if add_result:
-            await api.update_user(user_id, bonus_channels_count=1)
-            await api.create_log(user_id, "bonus_channel_claimed", username)
-        
-        await state.clear()
-        await message_manager.delete_temporary(message.chat.id, tag="loading")
-        
-        await start_bonus_training(
-            chat_id=message.chat.id,
-            user_id=user_id,
-            username=username,
-            message_manager=message_manager,
-            state=state,
-        )
-    else:
-        await message_manager.delete_temporary(message.chat.id, tag="loading")
-        await message_manager.send_temporary(
-            message.chat.id,
-            texts.get("cannot_access_channel", username=username),
-            auto_delete_after=5.0
-        )
+    await _add_channel_flow(message, message_manager, state)
 
 
-@router.callback_query(F.data == "settings")
+@router.callback_query(F.data.in_({"settings", "back_to_settings"}))
+@single_flight
 async def on_settings(
     callback: CallbackQuery,
     message_manager: MessageManager
 ):
-    """Show settings menu."""
-    await message_manager.send_toast(callback)
+    """Show settings menu (also the target of "back to settings")."""
+    fire_and_forget(message_manager.send_toast(callback))
     
     lang = await _get_user_lang(callback.from_user.id)
-    texts = get_texts(lang)
+    text, keyboard = _settings_menu(lang)
     
-    # Use edit_system to ensure temporary messages are deleted
-    success = await message_manager.edit_system(
+    await message_manager.show_menu(
         callback.message.chat.id,
-        texts.get("settings_title"),
-        reply_markup=get_settings_keyboard(lang),
-        tag="menu"
+        text,
+        reply_markup=keyboard
     )
-    if not success:
-        # Fallback to send_system if edit fails
-        await message_manager.send_system(
-            callback.message.chat.id,
-            texts.get("settings_title"),
-            reply_markup=get_settings_keyboard(lang),
-            tag="menu"
-        )
 
 
-@router.callback_query(F.data == "my_channels")
-async def on_my_channels(
+async def _show_my_channels(
     callback: CallbackQuery,
-    message_manager: MessageManager
+    message_manager: MessageManager,
+    page: int = 0
 ):
-    """Show user's channels."""
-    await message_manager.send_toast(callback)
+    """Render one page of the user's channel list.
+    
+    Only the rendering is paged: the channels endpoint has no offset/limit
+    and the page count needs the total, so the full (briefly cached) list
+    is fetched and sliced here. Lists are small - defaults, a bonus
+    channel and the few the user added.
+    """
     api = get_core_api()
     user_id = callback.from_user.id
-    lang = await _get_user_lang(user_id)
+    context, channels = await asyncio.gather(
+        api.get_feed_context(user_id),
+        api.get_user_channels(user_id),
+    )
+    lang = context["lang"]
+    has_bonus = context["has_bonus"]
     texts = get_texts(lang)
     
-    channels = await api.get_user_channels(user_id)
-    user_data = await api.get_user(user_id)
-    has_bonus = user_data.get("bonus_channels_count", 0) >= 1 if user_data else False
+    total_pages = max(1, -(-len(channels) // _CHANNELS_PAGE_SIZE))
+    page = min(max(page, 0), total_pages - 1)
     
     if not channels:
         text = texts.get("no_user_channels")
     else:
         text = texts.get("your_channels_header")
-        for ch in channels:
-            username = html.escape(ch.get("username", "Unknown"))
-            title = html.escape(ch.get("title", ""))
+        escape = html.escape
+        start = page * _CHANNELS_PAGE_SIZE
+        for ch in channels[start:start + _CHANNELS_PAGE_SIZE]:
+            # Text content only, so quotes don't need escaping
+            username = escape(ch.get("username", "Unknown"), quote=False)
+            title = escape(ch.get("title", ""), quote=False)
             text += f"• @{username} - {title}\n"
     
-    from bot.core import get_channels_view_keyboard
-    # Use edit_system to ensure temporary messages are deleted
-    success = await message_manager.edit_system(
+    await message_manager.show_menu(
         callback.message.chat.id,
         text,
-        reply_markup=get_channels_view_keyboard(lang, has_bonus_channel=has_bonus),
-        tag="menu"
-    )
-    if not success:
-        # Fallback to send_system if edit fails
-        await message_manager.send_system(
-            callback.message.chat.id,
-            text,
-            reply_markup=get_channels_view_keyboard(lang, has_bonus_channel=has_bonus),
-            tag="menu"
+        reply_markup=get_channels_view_keyboard(
+            lang, has_bonus_channel=has_bonus, page=page, total_pages=total_pages
         )
+    )
 
 
-@router.callback_query(F.data == "back_to_settings")
-async def on_back_to_settings(
+@router.callback_query(F.data == "my_channels")
+@single_flight
+async def on_my_channels(
     callback: CallbackQuery,
     message_manager: MessageManager
 ):
-    """Go back to settings menu."""
-    await message_manager.send_toast(callback)
-    lang = await _get_user_lang(callback.from_user.id)
-    texts = get_texts(lang)
-    
-    # Use edit_system to ensure temporary messages are deleted
-    success = await message_manager.edit_system(
-        callback.message.chat.id,
-        texts.get("settings_title"),
-        reply_markup=get_settings_keyboard(lang),
-        tag="menu"
-    )
-    if not success:
-        # Fallback to send_system if edit fails
-        await message_manager.send_system(
-            callback.message.chat.id,
-            texts.get("settings_title"),
-            reply_markup=get_settings_keyboard(lang),
-            tag="menu"
-        )
+    """Show user's channels."""
+    fire_and_forget(message_manager.send_toast(callback))
+    await _show_my_channels(callback, message_manager)
+
+
+@router.callback_query(F.data.startswith("my_channels:p:"))
+@single_flight
+async def on_my_channels_page(
+    callback: CallbackQuery,
+    message_manager: MessageManager
+):
+    """Switch page of the user's channel list."""
+    fire_and_forget(message_manager.send_toast(callback))
+    page = callback.data.rpartition(":")[2]
+    await _show_my_channels(callback, message_manager, int(page) if page.isdigit() else 0)
 
 
 @router.callback_query(F.data == "back_to_feed")
+@single_flight
 async def on_back_to_feed(
     callback: CallbackQuery,
     message_manager: MessageManager
 ):
     """Go back to feed menu."""
-    await message_manager.send_toast(callback)
+    fire_and_forget(message_manager.send_toast(callback))
     
-    api = get_core_api()
-    user_data = await api.get_user(callback.from_user.id)
-    has_bonus = user_data.get("bonus_channels_count", 0) >= 1 if user_data else False
-    lang = await _get_user_lang(callback.from_user.id)
-    texts = get_texts(lang)
+    text, keyboard = await _feed_ready_menu(callback.from_user.id)
     
-    # Use edit_system to ensure temporary messages are deleted
-    success = await message_manager.edit_system(
+    await message_manager.show_menu(
         callback.message.chat.id,
-        texts.get("feed_ready"),
-        reply_markup=get_feed_keyboard(lang, has_bonus_channel=has_bonus),
-        tag="menu"
+        text,
+        reply_markup=keyboard
     )
-    if not success:
-        # Fallback to send_system if edit fails
-        await message_manager.send_system(
-            callback.message.chat.id,
-            texts.get("feed_ready"),
-            reply_markup=get_feed_keyboard(lang, has_bonus_channel=has_bonus),
-            tag="menu"
-        )
 
 
 @router.callback_query(F.data == "cancel")
@@ -476,94 +430,26 @@ async def on_cancel(
     state: FSMContext
 ):
     """Cancel current operation - return to appropriate screen based on user status."""
-    lang = await _get_user_lang(callback.from_user.id)
+    api = get_core_api()
+    user_id = callback.from_user.id
+    context = await api.get_feed_context(user_id)
+    lang = context["lang"]
+    user_data = context["user"]
+    has_bonus = context["has_bonus"]
     texts = get_texts(lang)
     
-    await message_manager.send_toast(callback, texts.get("cancelled"))
-    
-    current_state = await state.get_state()
-    state_data = await state.get_data()
+    fire_and_forget(message_manager.send_toast(callback, texts.get("cancelled")))
     
+    current_state = str(await state.get_state() or "").lower()
     await state.clear()
     
-    api = get_core_api()
-    user_data = await api.get_user(callback.from_user.id)
-    
-    if user_data and user_data.get("user_role") in ("member", "admin"):
-        has_bonus = user_data.get("bonus_channels_count", 0) >= 1
-        success = await message_manager.edit_system(
-            callback.message.chat.id,
-            texts.get("feed_ready"),
-            reply_markup=get_feed_keyboard(lang, has_bonus_channel=has_bonus),
-            tag="menu"
-        )
-        if not success:
-            await message_manager.send_system(
-                callback.message.chat.id,
-                texts.get("feed_ready"),
-                reply_markup=get_feed_keyboard(lang, has_bonus_channel=has_bonus),
-                tag="menu"
-            )
-    elif current_state and "training" in str(current_state).lower():
-        from bot.core.keyboards import get_onboarding_keyboard
-        success = await message_manager.edit_system(
-            callback.message.chat.id,
-            texts.get("training_intro"),
-            reply_markup=get_onboarding_keyboard(lang),
-            tag="menu"
-        )
-        if not success:
-            await message_manager.send_system(
-                callback.message.chat.id,
-                texts.get("training_intro"),
-                reply_markup=get_onboarding_keyboard(lang),
-                tag="menu"
-            )
-    elif current_state and "adding" in str(current_state).lower():
-        has_bonus = user_data.get("bonus_channels_count", 0) >= 1 if user_data else False
-        if user_data and user_data.get("user_role") in ("member", "admin"):
-            success = await message_manager.edit_system(
-                callback.message.chat.id,
-                texts.get("feed_ready"),
-                reply_markup=get_feed_keyboard(lang, has_bonus_channel=has_bonus),
-                tag="menu"
-            )
-            if not success:
-                await message_manager.send_system(
-                    callback.message.chat.id,
-                    texts.get("feed_ready"),
-                    reply_markup=get_feed_keyboard(lang, has_bonus_channel=has_bonus),
-                    tag="menu"
-                )
-        else:
-            from bot.core.keyboards import get_onboarding_keyboard
-            success = await message_manager.edit_system(
-                callback.message.chat.id,
-                texts.get("training_intro"),
-                reply_markup=get_onboarding_keyboard(lang),
-                tag="menu"
-            )
-            if not success:
-                await message_manager.send_system(
-                    callback.message.chat.id,
-                    texts.get("training_intro"),
-                    reply_markup=get_onboarding_keyboard(lang),
-                    tag="menu"
-                )
+    if user_data.get("user_role") in ("member", "admin"):
+        text, reply_markup = _feed_menu(lang, has_bonus)
+    elif "training" in current_state or "adding" in current_state:
+        text, reply_markup = texts.get("training_intro"), get_onboarding_keyboard(lang)
     else:
-        from bot.core import get_start_keyboard
         name = html.escape(callback.from_user.first_name or "there")
-        success = await message_manager.edit_system(
-            callback.message.chat.id,
-            texts.get("welcome", name=name),
-            reply_markup=get_start_keyboard(lang),
-            tag="menu"
-        )
-        if not success:
-            await message_manager.send_system(
-                callback.message.chat.id,
-                texts.get("welcome", name=name),
-                reply_markup=get_start_keyboard(lang),
-                tag="menu"
-            )
+        text, reply_markup = texts.get("welcome", name=name), get_start_keyboard(lang)
+    
+    await message_manager.show_menu(callback.message.chat.id, text, reply_markup=reply_markup)
 
@@ -1,28 +1,40 @@
 """Feed view handlers (viewing posts, interactions)."""
 
+import asyncio
 import logging
-from datetime import datetime, timedelta
 
 from aiogram import Router, F
-from aiogram.types import CallbackQuery
+from aiogram.types import CallbackQuery, ReactionTypeEmoji
 
-from bot.core import MessageManager, get_texts, get_feed_keyboard, get_feed_post_keyboard
+from bot.core import (
+    MessageManager, FeedPostCallback, get_texts,
+    get_feed_keyboard, get_feed_post_keyboard,
+)
 from bot.services import get_core_api, get_user_bot
 from bot.services.media_service import MediaService
 from bot.services.post_service import PostService
-import html
 
 logger = logging.getLogger(__name__)
 router = Router()
 
-# Track processed callbacks to prevent double-click
-_processed_feed_callbacks: set = set()
+from bot.utils import (
+    TTLSet, single_flight, fire_and_forget, pick_initial_best_post, escape_channel_title,
+    POST_HEADER_LINK_TPL, POST_HEADER_TITLE_TPL, MEDIA_PLACEHOLDER,
+)
 
+# Track processed callbacks to prevent double-click
+_processed_feed_callbacks = TTLSet(max_size=2048, ttl=10.0)
 
-from bot.utils import get_user_lang as _get_user_lang
+# Reaction payloads for rated posts, built once
+_REACTIONS = {
+    "like": [ReactionTypeEmoji(emoji="👍")],
+    "dislike": [ReactionTypeEmoji(emoji="👎")],
+}
+_TOAST = {"like": "👍", "dislike": "👎", "skip": "⏭"}
 
 
 @router.callback_query(F.data == "view_feed")
+@single_flight
 async def on_view_feed(
     callback: CallbackQuery,
     message_manager: MessageManager
@@ -33,18 +45,21 @@ async def on_view_feed(
     user_id = callback.from_user.id
     chat_id = callback.message.chat.id
 
-    await api.update_activity(user_id)
-    await api.update_user(user_id, status="active")
+    fire_and_forget(api.update_activity(user_id))
 
-    user_data = await api.get_user(user_id)
-    lang = await _get_user_lang(user_id)
+    # Independent round-trips; fetch a larger pool of best posts for
+    # initial highlight and regular feed
+    _, context, all_posts = await asyncio.gather(
+        api.update_user(user_id, status="active"),
+        api.get_feed_context(user_id),
+        api.get_best_posts(user_id, limit=10),
+    )
+    user_data = context["user"]
+    has_bonus = context["has_bonus"]
+    lang = context["lang"]
     texts = get_texts(lang)
-
-    # Fetch a larger pool of best posts for initial highlight and regular feed
-    all_posts = await api.get_best_posts(user_id, limit=10)
     
     if not all_posts:
-        has_bonus = user_data.get("bonus_channels_count", 0) >= 1 if user_data else False
         await message_manager.send_system(
             chat_id,
             texts.get("feed_empty"),
@@ -55,23 +70,8 @@ async def on_view_feed(
     
     # Determine if we should send the one-time initial best post
     initial_best_post = None
-    if user_data and not user_data.get("initial_best_post_sent", False):
-        now = datetime.utcnow()
-        three_days_ago = now - timedelta(days=3)
-
-        for post in all_posts:
-            posted_at_raw = post.get("posted_at")
-            try:
-                posted_at = datetime.fromisoformat(posted_at_raw) if posted_at_raw else None
-            except Exception:
-                posted_at = None
-            if posted_at and posted_at >= three_days_ago:
-                initial_best_post = post
-                break
-
-        # Fallback: if nothing in last 3 days, take the first best post
-        if not initial_best_post:
-            initial_best_post = all_posts[0]
+    if context["exists"] and not user_data.get("initial_best_post_sent", False):
+        initial_best_post = pick_initial_best_post(all_posts)
 
     # Build list of feed posts (exclude initial best to avoid duplicates)
     feed_posts = []
@@ -83,82 +83,30 @@ async def on_view_feed(
         if len(feed_posts) >= 3:
             break
 
-    total_count = len(feed_posts) + (1 if initial_best_post else 0)
+    posts_to_send = ([initial_best_post] if initial_best_post else []) + feed_posts
+    
+    # Initialize services
+    user_bot = get_user_bot()
+    media_service = MediaService(user_bot)
+    post_service = PostService(message_manager, media_service, user_bot)
+    
+    # Missing post texts and media are fetched concurrently while the menu
+    # and earlier posts are sent; send_post picks the media up from the cache
+    formatting = asyncio.gather(*(_format_feed_post(post, user_bot) for post in posts_to_send))
+    for post in posts_to_send:
+        await media_service.prefetch_post_media(chat_id, post)
 
     # Show feed menu
-    has_bonus = user_data.get("bonus_channels_count", 0) >= 1 if user_data else False
     await message_manager.send_system(
         chat_id,
-        f"📰 {texts.get('feed_ready', default='Your Personalized Feed')} ({total_count})",
+        f"📰 {texts.get('feed_ready')} ({len(posts_to_send)})",
         reply_markup=get_feed_keyboard(lang, has_bonus_channel=has_bonus),
         tag="menu"
     )
     
-    # Initialize services
-    user_bot = get_user_bot()
-    media_service = MediaService(user_bot)
-    post_service = PostService(message_manager, media_service, user_bot)
-
-    # Send initial best post once, if applicable
-    if initial_best_post:
-        # Format post text with hyperlink (HTML)
-        channel_title = html.escape(initial_best_post.get("channel_title", "Unknown"))
-        channel_username = initial_best_post.get("channel_username", "").lstrip("@")
-        message_id = initial_best_post.get("telegram_message_id")
-        
-        # Get post text - fetch from user-bot if not available (fallback)
-        full_text_raw = initial_best_post.get("text") or ""
-        if not full_text_raw and channel_username and message_id:
-            user_bot = get_user_bot()
-            full_text_raw = await user_bot.get_post_text(channel_username, message_id) or ""
-        text = full_text_raw  # Already HTML formatted from user-bot
-        
-        if channel_username and message_id:
-            header = f"📰 <a href=\"https://t.me/{channel_username}/{message_id}\">{channel_title}</a>\n\n"
-        else:
-            header = f"📰 <b>{channel_title}</b>\n\n"
-        body = text if text else "<i>[Media content]</i>"
-        post_text = header + body
-        
-        # Update post dict with formatted text for post_service
-        formatted_post = initial_best_post.copy()
-        formatted_post["text"] = post_text
-        
-        await post_service.send_post(
-            chat_id,
-            formatted_post,
-            keyboard=get_feed_post_keyboard(initial_best_post.get("id"), lang) if initial_best_post.get("id") else None,
-            tag="feed_post",
-            message_type="regular",
-            include_relevance=True,
-        )
-        # Mark as sent so we don't repeat in future sessions
-        await api.update_user(user_id, initial_best_post_sent=True)
-
-    # Send remaining feed posts
-    for post in feed_posts:
-        # Format post text with hyperlink (HTML). Assume post['text'] is already HTML.
-        channel_title = html.escape(post.get("channel_title", "Unknown"))
-        channel_username = post.get("channel_username", "").lstrip("@")
-        message_id = post.get("telegram_message_id")
-        
-        # Get post text - fetch from user-bot if not available (fallback)
-        body = post.get("text") or ""
-        if not body and channel_username and message_id:
-            user_bot = get_user_bot()
-            body = await user_bot.get_post_text(channel_username, message_id) or ""
-        body = body or "<i>[Media content]</i>"
-        
-        if channel_username and message_id:
-            header = f"📰 <a href=\"https://t.me/{channel_username}/{message_id}\">{channel_title}</a>\n\n"
-        else:
-            header = f"📰 <b>{channel_title}</b>\n\n"
-        post_text = header + body
-        
-        # Update post dict with formatted text for post_service
-        formatted_post = post.copy()
-        formatted_post["text"] = post_text
-        
+    # Sends stay sequential: chat order matters, and the rating buttons
+    # rely on the post being the message right before them
+    for post, formatted_post in zip(posts_to_send, await formatting):
         await post_service.send_post(
             chat_id,
             formatted_post,
@@ -167,11 +115,38 @@ async def on_view_feed(
             message_type="regular",
             include_relevance=True,
         )
+        if post is initial_best_post:
+            # Mark as sent so we don't repeat in future sessions
+            fire_and_forget(api.update_user(user_id, initial_best_post_sent=True))
+
+
+async def _format_feed_post(post: dict, user_bot) -> dict:
+    """Copy of post with its text replaced by the HTML header + body."""
+    channel_title = escape_channel_title(post.get("channel_title", "Unknown"))
+    channel_username = (post.get("channel_username") or "").lstrip("@")
+    message_id = post.get("telegram_message_id")
+    
+    # Post text is already HTML from user-bot; fetch it if not available (fallback)
+    body = post.get("text") or ""
+    if not body and channel_username and message_id:
+        body = await user_bot.get_post_text(channel_username, message_id) or ""
+    
+    if channel_username and message_id:
+        header = POST_HEADER_LINK_TPL.format(
+            username=channel_username, message_id=message_id, title=channel_title
+        )
+    else:
+        header = POST_HEADER_TITLE_TPL.format(title=channel_title)
+    
+    formatted_post = post.copy()
+    formatted_post["text"] = header + (body or MEDIA_PLACEHOLDER)
+    return formatted_post
 
 
-@router.callback_query(F.data.startswith("feed:"))
+@router.callback_query(FeedPostCallback.filter())
 async def on_feed_interaction(
     callback: CallbackQuery,
+    callback_data: FeedPostCallback,
     message_manager: MessageManager
 ):
     """Handle feed post interactions (like/dislike/skip)."""
@@ -181,49 +156,35 @@ async def on_feed_interaction(
         return
     _processed_feed_callbacks.add(callback_key)
     
-    if len(_processed_feed_callbacks) > 100:
-        _processed_feed_callbacks.clear()
-    
-    _, action, post_id = callback.data.split(":")
-    post_id = int(post_id)
+    action = callback_data.action
+    post_id = callback_data.post_id
     
-    # Show toast based on action
-    if action == "like":
-        await message_manager.send_toast(callback, "👍")
-    elif action == "dislike":
-        await message_manager.send_toast(callback, "👎")
-    else:
-        await message_manager.send_toast(callback, "⏭")
+    # Toast only needs to appear; don't hold the writes on it
+    fire_and_forget(message_manager.send_toast(callback, _TOAST.get(action, _TOAST["skip"])))
     
     api = get_core_api()
+    bot = message_manager.bot
     user_id = callback.from_user.id
     chat_id = callback.message.chat.id
     
-    await api.update_activity(user_id)
-    
+    jobs = [
+        api.update_activity(user_id),
+        # Delete the 👆 message with buttons
+        bot.delete_message(chat_id, callback.message.message_id),
+    ]
     # Only create interaction for like/dislike, not skip
     if action != "skip":
-        await api.create_interaction(user_id, post_id, action)
-        await api.create_log(user_id, f"feed_post_{action}", f"post_id={post_id}")
-    
-    # Delete the 👆 message with buttons
-    try:
-        await message_manager.bot.delete_message(chat_id, callback.message.message_id)
-    except Exception:
-        pass
-    
-    # Set reaction on the post (message before this one)
-    # The post message_id is one less than the buttons message_id
-    post_message_id = callback.message.message_id - 1
-    if action != "skip":
-        try:
-            from aiogram.types import ReactionTypeEmoji
-            reaction = ReactionTypeEmoji(emoji="👍" if action == "like" else "👎")
-            await message_manager.bot.set_message_reaction(
+        fire_and_forget(api.create_log(user_id, f"feed_post_{action}", f"post_id={post_id}"))
+        jobs += [
+            api.create_interaction(user_id, post_id, action),
+            # Set reaction on the post: its message_id is one less than the buttons message
+            bot.set_message_reaction(
                 chat_id=chat_id,
-                message_id=post_message_id,
-                reaction=[reaction]
-            )
-        except Exception as e:
-            logger.debug(f"Could not set reaction: {e}")
-
+                message_id=callback.message.message_id - 1,
+                reaction=_REACTIONS[action],
+            ),
+        ]
+    
+    for result in await asyncio.gather(*jobs, return_exceptions=True):
+        if isinstance(result, Exception):
+            logger.debug("Feed interaction side effect failed: %s", result)
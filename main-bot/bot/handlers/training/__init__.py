@@ -5,7 +5,7 @@ from bot.handlers.training.rating import router as rating_router
 from bot.handlers.training.retrain import router as retrain_router, start_full_retrain, start_bonus_training
 from bot.handlers.training.helpers import (
     _start_training_session,
-    _bonus_channel_nudge_watcher,
+    send_bonus_channel_nudge,
     send_initial_best_post,
     finish_training_flow,
     show_training_post,
@@ -21,7 +21,7 @@ __all__ = [
     "start_full_retrain",
     "start_bonus_training",
     "_start_training_session",
-    "_bonus_channel_nudge_watcher",
+    "send_bonus_channel_nudge",
     "send_initial_best_post",
     "finish_training_flow",
     "show_training_post",
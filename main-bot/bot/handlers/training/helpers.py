@@ -2,21 +2,22 @@
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
 
 from aiogram.fsm.context import FSMContext
 from aiogram.enums import ParseMode
+from aiogram.types import InputMediaPhoto, BufferedInputFile, LinkPreviewOptions
 
-from bot.core import MessageManager, get_texts, get_settings
+from bot.core import MessageManager, TextManager, get_texts, get_settings
 from bot.core.states import TrainingStates
-from bot.services import get_core_api, get_user_bot, get_post_cache
-from bot.services.media_service import MediaService
-import html
+from bot.core.message_registry import ManagedMessage, MessageType
+from bot.services import get_core_api, get_user_bot, get_post_cache, EMPTY_USER
+from bot.services.media_service import MediaService, media_file_ids
+from bot.delayed_jobs import get_delayed_jobs
 import base64
-from bot.utils import TELEGRAM_CAPTION_LIMIT
+from bot.utils import fits_in_caption, pick_initial_best_post, escape_channel_title, POST_HEADER_LINK_TPL, POST_HEADER_TITLE_TPL, MEDIA_PLACEHOLDER, parse_media_ids
 from bot.core import (
     get_training_post_keyboard, get_feed_keyboard, get_training_complete_keyboard,
-    get_bonus_channel_keyboard,
+    get_bonus_channel_keyboard, get_feed_post_keyboard,
 )
 
 logger = logging.getLogger(__name__)
@@ -34,7 +35,13 @@ def _get_media_service() -> MediaService:
     return _media_service
 
 
-from bot.utils import get_user_lang as _get_user_lang
+from bot.utils import get_user_lang as _get_user_lang, fire_and_forget
+
+# How many upcoming training posts to prefetch, and how many may hit user-bot at once
+_PREFETCH_AHEAD = 5
+_prefetch_slots = asyncio.Semaphore(3)
+# Posts being prefetched right now; consecutive renders ask for overlapping windows
+_prefetching: set[int] = set()
 
 
 async def _prefetch_post_content(
@@ -50,6 +57,9 @@ async def _prefetch_post_content(
         channel_username: Channel username
         message_id: Telegram message ID
     """
+    if post_id in _prefetching:
+        return
+    _prefetching.add(post_id)
     try:
         # Check cache first
         post_cache = get_post_cache()
@@ -61,7 +71,8 @@ async def _prefetch_post_content(
         
         # Fetch from user-bot
         user_bot = get_user_bot()
-        full_content = await user_bot.get_post_full_content(channel_username, message_id)
+        async with _prefetch_slots:
+            full_content = await user_bot.get_post_full_content(channel_username, message_id)
         
         if full_content:
             # Cache the content
@@ -71,9 +82,60 @@ async def _prefetch_post_content(
                 media_type=full_content.get("media_type"),
                 media_data=full_content.get("media_data")  # base64 string
             )
-            logger.debug(f"Prefetched and cached post content (post_id={post_id})")
+            logger.debug("Prefetched and cached post content (post_id=%s)", post_id)
     except Exception as e:
-        logger.error(f"Error prefetching post content (post_id={post_id}): {e}")
+        logger.error("Error prefetching post content (post_id=%s): %s", post_id, e)
+    finally:
+        _prefetching.discard(post_id)
+
+
+# How long the training intro screens wait for a single channel scrape
+_SCRAPE_TIMEOUT = 8.0
+
+
+async def _scrape_with_timeout(channel: str, limit: int, timeout: float = _SCRAPE_TIMEOUT) -> None:
+    """Scrape a channel for the intro screen, giving up after `timeout` seconds.
+    
+    Never raises, so one slow or failing channel doesn't abort the others.
+    The scrape itself is shared and keeps running in the background.
+    """
+    try:
+        async with asyncio.timeout(timeout):
+            await get_user_bot().scrape_channel(channel, limit=limit)
+    except TimeoutError:
+        logger.warning("Scrape of %s timed out after %.0fs", channel, timeout)
+    except Exception as e:
+        logger.warning("Scrape of %s failed: %s", channel, e)
+
+
+def _format_training_post_text(
+    texts: TextManager,
+    current: int,
+    total: int,
+    channel_title: str,
+    channel_username: str,
+    msg_id: int | None,
+    post_text: str,
+) -> str:
+    """Build the training post body: progress header, source line, then the post text.
+    
+    channel_title must already be HTML-escaped.
+    """
+    if channel_username and msg_id:
+        source = f'<a href="https://t.me/{channel_username}/{msg_id}">{channel_title}</a>'
+    else:
+        source = channel_title
+    return "".join((
+        f"📰 <b>{texts.get('post_label')} {current}/{total}</b>\n",
+        f"{texts.get('from_label')}: {source}\n\n",
+        post_text or MEDIA_PLACEHOLDER,
+    ))
+
+
+async def _lang_from_state(data: dict) -> str:
+    """Language stored in the training FSM data, fetched from the API only if missing."""
+    user_id = data.get("user_id")
+    return data.get("lang") or (await _get_user_lang(user_id) if user_id else "en_US")
 
 
 async def _start_training_session(
@@ -86,6 +148,15 @@ async def _start_training_session(
     data = await state.get_data()
     posts = data.get("training_posts", [])
     
+    # Resolve the language and parse media ids once per session;
+    # later posts read both from state
+    for post in posts:
+        parse_media_ids(post)
+    data = await state.update_data(
+        training_posts=posts,
+        lang=data.get("lang") or await _get_user_lang(user_id),
+    )
+    
     # Prefetch first two posts (index 0 and 1) in background
     if posts:
         post_cache = get_post_cache()
@@ -105,60 +176,238 @@ async def _start_training_session(
                             _prefetch_post_content(post_id, channel_username, msg_id)
                         )
 
-    await show_training_post(chat_id, message_manager, state)
+    await show_training_post(chat_id, message_manager, state, data)
+
 
+# Bonus channel reminders go out 1 min, then 1 hour, then 1 day apart
+_BONUS_NUDGE_DELAYS = (60, 3600, 24 * 3600)
 
-async def _bonus_channel_nudge_watcher(
+
+async def send_bonus_channel_nudge(
     chat_id: int,
     user_id: int,
+    stage: int,
     message_manager: MessageManager,
 ) -> None:
-    """Напоминания забрать бонусный канал через 1 мин, 1 час и 1 день."""
+    """Напомнить забрать бонусный канал (stage 1..3) и запланировать следующее напоминание."""
     api = get_core_api()
-    thresholds = [60, 3600, 24 * 3600]
+    user = await api.get_user(user_id)
+    if not user or user.get("bonus_channels_count", 0) >= 1:
+        return
 
-    for stage, delay in enumerate(thresholds, start=1):
-        try:
-            await asyncio.sleep(delay)
+    lang = await _get_user_lang(user_id)
+    texts = get_texts(lang)
+    text = texts.get(f"bonus_nudge_{stage}")
+    if not text:
+        text = "🎁 You still have a free bonus channel to claim."
 
-            user = await api.get_user(user_id)
-            if not user:
-                break
+    await message_manager.send_temporary(
+        chat_id,
+        text,
+        reply_markup=get_bonus_channel_keyboard(lang),
+        tag="bonus_nudge",
+    )
 
-            if user.get("bonus_channels_count", 0) >= 1:
-                break
+    if stage < len(_BONUS_NUDGE_DELAYS):
+        await get_delayed_jobs().schedule(
+            "bonus_nudge",
+            {"chat_id": chat_id, "user_id": user_id, "stage": stage + 1},
+            _BONUS_NUDGE_DELAYS[stage],
+        )
 
-            lang = await _get_user_lang(user_id)
-            texts = get_texts(lang)
-            key = f"bonus_nudge_{stage}"
-            text = texts.get(key)
-            if not text:
-                text = "🎁 You still have a free bonus channel to claim."
 
-            await message_manager.send_temporary(
-                chat_id,
-                text,
-                reply_markup=get_bonus_channel_keyboard(lang),
-                tag="bonus_nudge",
+async def _register_training_content(message_manager: MessageManager, chat_id: int, message_id: int) -> None:
+    """Track a post message sent straight through the bot as REGULAR training content."""
+    await message_manager.registry.register(
+        ManagedMessage(
+            message_id=message_id,
+            chat_id=chat_id,
+            message_type=MessageType.REGULAR,
+            tag="training_post_content",
+        )
+    )
+
+
+async def _send_training_text(chat_id: int, message_manager: MessageManager, text: str) -> int | None:
+    """Send the post text alone; returns its message id."""
+    post_msg = await message_manager.send_regular(
+        chat_id=chat_id,
+        text=text,
+        tag="training_post_content",
+    )
+    return post_msg.message_id if post_msg else None
+
+
+async def _send_training_album(
+    chat_id: int,
+    message_manager: MessageManager,
+    post_id: int,
+    channel_username: str,
+    media_ids: list[int],
+    text: str,
+) -> int | None:
+    """Send an album, then the text; returns the message id to react on (None if nothing was sent)."""
+    # Re-send by file_id when every photo was uploaded before
+    album_file_ids = [media_file_ids.get(channel_username, mid) for mid in media_ids]
+    if all(album_file_ids):
+        media_items = [InputMediaPhoto(media=file_id) for file_id in album_file_ids]
+    else:
+        photos_data = await _get_media_service().get_cached_photos(chat_id, post_id)
+        if not photos_data:
+            user_bot = get_user_bot()
+            results = await asyncio.gather(
+                *(user_bot.get_photo(channel_username, mid) for mid in media_ids),
+                return_exceptions=True,
             )
-        except Exception as e:
-            logger.error(f"Error in bonus channel nudge watcher for user {user_id}: {e}")
-            break
+            photos_data = [r for r in results if r and not isinstance(r, Exception)]
+        media_items = [
+            InputMediaPhoto(media=BufferedInputFile(
+                photo_bytes, filename=f"{media_ids[i] if i < len(media_ids) else i}.jpg"
+            ))
+            for i, photo_bytes in enumerate(photos_data)
+        ]
+    if not media_items:
+        return None
+    
+    msgs = await message_manager.bot.send_media_group(chat_id=chat_id, media=media_items)
+    # Remember file_ids only when every photo made it, so ids line up
+    if len(msgs) == len(media_ids):
+        for mid, msg in zip(media_ids, msgs):
+            media_file_ids.remember(channel_username, mid, msg)
+    for msg in msgs:
+        await _register_training_content(message_manager, chat_id, msg.message_id)
+    
+    # Text goes separately; react on it if it was sent, otherwise on the first photo
+    post_message_id = await _send_training_text(chat_id, message_manager, text)
+    if post_message_id is None and msgs:
+        post_message_id = msgs[0].message_id
+    return post_message_id
 
 
-async def show_training_post(chat_id: int, message_manager: MessageManager, state: FSMContext):
+async def _send_training_photo(
+    chat_id: int,
+    message_manager: MessageManager,
+    post: dict,
+    text: str,
+    caption_fits: bool,
+    photo_bytes: bytes | None,
+) -> int | None:
+    """Send a photo post (single photo or album); returns the message id to react on."""
+    channel_username = post.get("channel_username", "").lstrip("@")
+    media_ids = parse_media_ids(post)
+    post_id = post.get("id", 0)
+    if not channel_username or not (media_ids or photo_bytes):
+        return None
+    if len(media_ids) > 1:
+        return await _send_training_album(chat_id, message_manager, post_id, channel_username, media_ids, text)
+    
+    # Single photo - re-send by file_id if it was uploaded before
+    mid = media_ids[0] if media_ids else None
+    photo_file_id = media_file_ids.get(channel_username, mid) if mid else None
+    if photo_file_id:
+        # send_regular prefers bytes, so drop them or the photo is uploaded again
+        photo_bytes = None
+    elif not photo_bytes:
+        photo_bytes = await _get_media_service().get_cached_photo(chat_id, post_id)
+        if not photo_bytes and mid:
+            try:
+                photo_bytes = await get_user_bot().get_photo(channel_username, mid)
+            except Exception:
+                photo_bytes = None
+    if not photo_file_id and not photo_bytes:
+        return None
+    
+    if caption_fits:
+        post_msg = await message_manager.send_regular(
+            chat_id=chat_id,
+            text=text,
+            photo=photo_file_id,
+            photo_bytes=photo_bytes,
+            photo_filename=f"{mid}.jpg",
+            tag="training_post_content",
+        )
+        if post_msg is None:
+            return None
+        if mid and not photo_file_id:
+            media_file_ids.remember(channel_username, mid, post_msg)
+        return post_msg.message_id
+    
+    # Photo without caption, text sent separately and used for the reaction
+    photo_input = photo_file_id or BufferedInputFile(photo_bytes, filename=f"{mid}.jpg")
+    msg = await message_manager.bot.send_photo(chat_id=chat_id, photo=photo_input)
+    if mid and not photo_file_id:
+        media_file_ids.remember(channel_username, mid, msg)
+    await _register_training_content(message_manager, chat_id, msg.message_id)
+    return await _send_training_text(chat_id, message_manager, text)
+
+
+async def _send_training_video(
+    chat_id: int,
+    message_manager: MessageManager,
+    post: dict,
+    text: str,
+    caption_fits: bool,
+    video_bytes: bytes | None,
+) -> int | None:
+    """Send a video post; returns the message id to react on."""
+    channel_username = post.get("channel_username", "").lstrip("@")
+    msg_id = post.get("telegram_message_id")
+    if not channel_username or not msg_id:
+        return None
+    if not video_bytes:
+        video_bytes = await _get_media_service().get_cached_video(chat_id, post.get("id", 0))
+    if not video_bytes:
+        try:
+            video_bytes = await get_user_bot().get_video(channel_username, msg_id)
+        except Exception:
+            video_bytes = None
+    if not video_bytes:
+        logger.warning("Failed to download video for post %s, sending text only", post.get('id'))
+        return None
+    
+    input_file = BufferedInputFile(video_bytes, filename=f"{msg_id}.mp4")
+    if caption_fits:
+        msg = await message_manager.bot.send_video(
+            chat_id=chat_id,
+            video=input_file,
+            caption=text,
+            parse_mode=ParseMode.HTML,
+        )
+        await _register_training_content(message_manager, chat_id, msg.message_id)
+        return msg.message_id
+    
+    # Video without caption, text sent separately and used for the reaction
+    msg = await message_manager.bot.send_video(chat_id=chat_id, video=input_file)
+    await _register_training_content(message_manager, chat_id, msg.message_id)
+    return await _send_training_text(chat_id, message_manager, text)
+
+
+# Media senders by post media type; anything else is sent as text
+_TRAINING_RENDERERS = {
+    "photo": _send_training_photo,
+    "video": _send_training_video,
+}
+
+
+async def show_training_post(
+    chat_id: int,
+    message_manager: MessageManager,
+    state: FSMContext,
+    data: dict | None = None,
+):
     """Display current training post for rating.
     
     Sends two messages:
     1. Regular message - post content (text/media) without buttons
     2. Temporary message - progress text + rating buttons
-    """
-    from aiogram.types import InputMediaPhoto, BufferedInputFile
     
-    data = await state.get_data()
+    Callers that just wrote the state can pass the dict returned by
+    state.update_data() as `data` to skip re-reading it from storage.
+    """
+    if data is None:
+        data = await state.get_data()
     posts = data.get("training_posts", [])
     queue = data.get("training_queue", [])
-    user_id = data.get("user_id")
     
     # Get current post index from queue (if using queue) or fallback to current_post_index
     if queue:
@@ -171,14 +420,34 @@ async def show_training_post(chat_id: int, message_manager: MessageManager, stat
         await finish_training_flow(chat_id, message_manager, state)
         return
     
+    # Prefetch the next posts' content and media first, so it overlaps all of this
+    # post's work (both prefetchers skip cached/in-flight posts and cap downloads)
+    if queue:
+        next_indices = queue[1:1 + _PREFETCH_AHEAD]
+    else:
+        next_indices = range(index + 1, min(index + 1 + _PREFETCH_AHEAD, len(posts)))
+    media_service = _get_media_service()
+    for next_index in next_indices:
+        if next_index >= len(posts):
+            continue
+        next_post = posts[next_index]
+        fire_and_forget(media_service.prefetch_post_media(chat_id, next_post))
+        next_post_id = next_post.get("id")
+        next_channel_username = next_post.get("channel_username", "").lstrip("@")
+        next_msg_id = next_post.get("telegram_message_id")
+        if next_post_id and next_channel_username and next_msg_id:
+            fire_and_forget(
+                _prefetch_post_content(next_post_id, next_channel_username, next_msg_id)
+            )
+    
     post = posts[index]
     
     # Get user language for localized texts
-    lang = await _get_user_lang(user_id)
+    lang = await _lang_from_state(data)
     texts = get_texts(lang)
     
     # Format post text (fetch from Redis cache or user-bot)
-    channel_title = html.escape(post.get("channel_title", "Unknown Channel"))
+    channel_title = escape_channel_title(post.get("channel_title", "Unknown Channel"))
     channel_username = post.get("channel_username", "").lstrip("@")
     msg_id = post.get("telegram_message_id")
     post_id = post.get("id")
@@ -218,279 +487,46 @@ async def show_training_post(chat_id: int, message_manager: MessageManager, stat
                     media_data=cached_media_data
                 )
     
-    # Prefetch next post content in background
-    # If using queue, prefetch next item in queue, otherwise prefetch index + 1
-    next_index = None
-    if queue and len(queue) > 1:
-        next_index = queue[1]  # Second item in queue is next post
-    elif not queue and index + 1 < len(posts):
-        next_index = index + 1
-    
-    if next_index is not None and next_index < len(posts):
-        next_post = posts[next_index]
-        next_post_id = next_post.get("id")
-        next_channel_username = next_post.get("channel_username", "").lstrip("@")
-        next_msg_id = next_post.get("telegram_message_id")
-        
-        if next_post_id and next_channel_username and next_msg_id:
-            # Check if next post is already cached
-            post_cache = get_post_cache()
-            next_cached = await post_cache.get_post_content(next_post_id)
-            
-            if not next_cached:
-                # Prefetch next post content in background
-                asyncio.create_task(
-                    _prefetch_post_content(next_post_id, next_channel_username, next_msg_id)
-                )
-    
     # Build post text with hyperlink to original (HTML format) - WITHOUT progress info
     # Calculate progress: current position in queue or index
     if queue:
         progress_current = len(posts) - len(queue) + 1
     else:
         progress_current = index + 1
-    text = f"📰 <b>{texts.get('post_label', default='Post')} {progress_current}/{len(posts)}</b>\n"
-    if channel_username and msg_id:
-        text += f"{texts.get('from_label', default='From')}: <a href=\"https://t.me/{channel_username}/{msg_id}\">{channel_title}</a>\n\n"
-    else:
-        text += f"{texts.get('from_label', default='From')}: {channel_title}\n\n"
-    text += post_text if post_text else "<i>[Media content]</i>"
+    text = _format_training_post_text(
+        texts, progress_current, len(posts), channel_title, channel_username, msg_id, post_text
+    )
     # Telegram counts caption length without HTML tags
-    from bot.utils import get_html_text_length
-    caption_fits = get_html_text_length(text) <= TELEGRAM_CAPTION_LIMIT
-    post_message_id = None
+    caption_fits = fits_in_caption(text)
 
     # Send post as REGULAR message (text/media only, no buttons)
     # Use cached media from Redis if available
     media_type_to_use = cached_media_type or post.get("media_type")
+    renderer = _TRAINING_RENDERERS.get(media_type_to_use)
+    post_message_id = None
     
-    if media_type_to_use == "photo":
-        # Try to use cached media data from Redis first
-        photo_bytes_from_cache = None
-        if cached_media_data:
-            try:
-                photo_bytes_from_cache = base64.b64decode(cached_media_data.encode('utf-8'))
-            except Exception as e:
-                logger.warning(f"Failed to decode cached media_data for post {post_id}: {e}")
-        
-        media_ids_str = post.get("media_file_id") or ""
-        media_ids: list[int] = []
-        if media_ids_str:
-            for part in media_ids_str.split(","):
-                part = part.strip()
-                if part.isdigit():
-                    media_ids.append(int(part))
-        else:
-            msg_id = post.get("telegram_message_id")
-            if isinstance(msg_id, int):
-                media_ids.append(msg_id)
-
-        if channel_username and (media_ids or photo_bytes_from_cache):
-            user_bot = get_user_bot()
-            media_service = _get_media_service()
-            cached_photo = await media_service.get_cached_photo(chat_id, post.get("id", 0))
-            cached_photos = await media_service.get_cached_photos(chat_id, post.get("id", 0))
-            cached = {"photo": cached_photo, "photos": cached_photos} if cached_photo or cached_photos else None
-            
-            # Prefer Redis cached media over in-memory cache
-            if photo_bytes_from_cache:
-                cached = {"photo": photo_bytes_from_cache}
-
-            if len(media_ids) > 1:
-                # Album
-                if cached and cached.get("photos"):
-                    photos_data = cached["photos"]
-                else:
-                    tasks = [user_bot.get_photo(channel_username, mid) for mid in media_ids]
-                    results = await asyncio.gather(*tasks, return_exceptions=True)
-                    photos_data = [r for r in results if r and not isinstance(r, Exception)]
-
-                media_items: list[InputMediaPhoto] = []
-                for i, photo_bytes in enumerate(photos_data):
-                    input_file = BufferedInputFile(photo_bytes, filename=f"{media_ids[i] if i < len(media_ids) else i}.jpg")
-                    media_items.append(InputMediaPhoto(media=input_file))
-                if media_items:
-                    msgs = await message_manager.bot.send_media_group(
-                        chat_id=chat_id,
-                        media=media_items,
-                    )
-                    # Register all album messages as regular
-                    from bot.core.message_registry import ManagedMessage, MessageType
-                    for msg in msgs:
-                        managed = ManagedMessage(
-                            message_id=msg.message_id,
-                            chat_id=chat_id,
-                            message_type=MessageType.REGULAR,
-                            tag="training_post_content"
-                        )
-                        await message_manager.registry.register(managed)
-                    # Use first message of album for reaction
-                    post_message_id = msgs[0].message_id if msgs else None
-                    # Send text separately as regular message
-                    post_msg = await message_manager.send_regular(
-                        chat_id=chat_id,
-                        text=text,
-                        tag="training_post_content",
-                    )
-                    # Use text message for reaction if available, otherwise first photo
-                    if post_msg:
-                        post_message_id = post_msg.message_id
-                else:
-                    # Album failed to load - send text only
-                    post_msg = await message_manager.send_regular(
-                        chat_id=chat_id,
-                        text=text,
-                        tag="training_post_content",
-                    )
-                    if post_msg:
-                        post_message_id = post_msg.message_id
-            else:
-                # Single photo
-                mid = media_ids[0]
-                if cached and cached.get("photo"):
-                    photo_bytes = cached["photo"]
-                else:
-                    try:
-                        photo_bytes = await user_bot.get_photo(channel_username, mid)
-                    except Exception:
-                        photo_bytes = None
-                if photo_bytes:
-                    if caption_fits:
-                        post_msg = await message_manager.send_regular(
-                            chat_id=chat_id,
-                            text=text,
-                            photo_bytes=photo_bytes,
-                            photo_filename=f"{mid}.jpg",
-                            tag="training_post_content",
-                        )
-                        if post_msg:
-                            post_message_id = post_msg.message_id
-                    else:
-                        # Photo without caption, text sent separately
-                        input_file = BufferedInputFile(photo_bytes, filename=f"{mid}.jpg")
-                        msg = await message_manager.bot.send_photo(chat_id=chat_id, photo=input_file)
-                        # Register photo as regular
-                        from bot.core.message_registry import ManagedMessage, MessageType
-                        managed = ManagedMessage(
-                            message_id=msg.message_id,
-                            chat_id=chat_id,
-                            message_type=MessageType.REGULAR,
-                            tag="training_post_content"
-                        )
-                        await message_manager.registry.register(managed)
-                        post_msg = await message_manager.send_regular(
-                            chat_id=chat_id,
-                            text=text,
-                            tag="training_post_content",
-                        )
-                        # Use text message for reaction
-                        if post_msg:
-                            post_message_id = post_msg.message_id
-                else:
-                    # Photo failed to load - send text only
-                    post_msg = await message_manager.send_regular(
-                        chat_id=chat_id,
-                        text=text,
-                        tag="training_post_content",
-                    )
-                    if post_msg:
-                        post_message_id = post_msg.message_id
-        else:
-            # No channel_username or media_ids for photo - send text only
-            post_msg = await message_manager.send_regular(
-                chat_id=chat_id,
-                text=text,
-                tag="training_post_content",
-            )
-            if post_msg:
-                post_message_id = post_msg.message_id
-
-    elif media_type_to_use == "video" and channel_username and msg_id:
-        # Try to use cached media data from Redis first
-        video_bytes = None
+    if renderer is not None:
+        media_bytes = None
         if cached_media_data:
             try:
-                video_bytes = base64.b64decode(cached_media_data.encode('utf-8'))
+                media_bytes = base64.b64decode(cached_media_data.encode('utf-8'))
             except Exception as e:
-                logger.warning(f"Failed to decode cached video media_data for post {post_id}: {e}")
-        
-        if not video_bytes:
-            user_bot = get_user_bot()
-            media_service = _get_media_service()
-            cached_video = await media_service.get_cached_video(chat_id, post.get("id", 0))
-            if cached_video:
-                video_bytes = cached_video
+                logger.warning("Failed to decode cached media_data for post %s: %s", post_id, e)
+        try:
+            post_message_id = await renderer(chat_id, message_manager, post, text, caption_fits, media_bytes)
+        except Exception as e:
+            # Skip the broken post rather than leave the user without rating controls
+            logger.warning("Failed to send %s for post %s: %s", media_type_to_use, post_id, e)
+            if queue:
+                data = await state.update_data(training_queue=queue[1:])
             else:
-                try:
-                    video_bytes = await user_bot.get_video(channel_username, msg_id)
-                except Exception:
-                    video_bytes = None
-        
-        if video_bytes:
-            try:
-                input_file = BufferedInputFile(video_bytes, filename=f"{msg_id}.mp4")
-                if caption_fits:
-                    msg = await message_manager.bot.send_video(
-                        chat_id=chat_id,
-                        video=input_file,
-                        caption=text,
-                        parse_mode=ParseMode.HTML,
-                    )
-                    # Register video message as regular
-                    from bot.core.message_registry import ManagedMessage, MessageType
-                    managed = ManagedMessage(
-                        message_id=msg.message_id,
-                        chat_id=chat_id,
-                        message_type=MessageType.REGULAR,
-                        tag="training_post_content"
-                    )
-                    await message_manager.registry.register(managed)
-                    post_message_id = msg.message_id
-                else:
-                    msg = await message_manager.bot.send_video(chat_id=chat_id, video=input_file)
-                    # Register video as regular
-                    from bot.core.message_registry import ManagedMessage, MessageType
-                    managed = ManagedMessage(
-                        message_id=msg.message_id,
-                        chat_id=chat_id,
-                        message_type=MessageType.REGULAR,
-                        tag="training_post_content"
-                    )
-                    await message_manager.registry.register(managed)
-                    post_msg = await message_manager.send_regular(
-                        chat_id=chat_id,
-                        text=text,
-                        tag="training_post_content",
-                    )
-                    # Use text message for reaction
-                    if post_msg:
-                        post_message_id = post_msg.message_id
-            except Exception as e:
-                logger.warning(f"Failed to send video for post {post.get('id')}: {e}")
-                new_index = index + 1
-                await state.update_data(current_post_index=new_index)
-                await show_training_post(chat_id, message_manager, state)
-                return
-        else:
-            # Video failed to download - send text only
-            logger.warning(f"Failed to download video for post {post.get('id')}, sending text only")
-            post_msg = await message_manager.send_regular(
-                chat_id=chat_id,
-                text=text,
-                tag="training_post_content",
-            )
-            if post_msg:
-                post_message_id = post_msg.message_id
+                data = await state.update_data(current_post_index=index + 1)
+            await show_training_post(chat_id, message_manager, state, data)
+            return
 
-    # Send text-only post as regular message if not already sent
+    # Send text-only post as regular message if media wasn't sent
     if post_message_id is None:
-        post_msg = await message_manager.send_regular(
-            chat_id=chat_id,
-            text=text,
-            tag="training_post_content",
-        )
-        if post_msg:
-            post_message_id = post_msg.message_id
+        post_message_id = await _send_training_text(chat_id, message_manager, text)
     
     # Now send temporary message with progress and buttons
     total = len(posts)
@@ -506,17 +542,11 @@ async def show_training_post(chat_id: int, message_manager: MessageManager, stat
     await state.update_data(
         current_post_message_id=post_message_id,
     )
-    
-    # Start background prefetch for next posts
-    media_service = _get_media_service()
-    asyncio.create_task(
-        media_service.prefetch_posts_media(chat_id, posts, index + 1, count=3)
-    )
 
 
 async def finish_training_flow(chat_id: int, message_manager: MessageManager, state: FSMContext):
     """Complete training and update user status."""
-    logger.info(f"finish_training_flow called for chat_id={chat_id}")
+    logger.info("finish_training_flow called for chat_id=%s", chat_id)
     api = get_core_api()
     data = await state.get_data()
     
@@ -529,51 +559,50 @@ async def finish_training_flow(chat_id: int, message_manager: MessageManager, st
     
     # Reset user status from "training" to "active"
     # Role will be updated to MEMBER automatically in mark_training_complete
+    # (the PATCH returns the fresh user row, reused below for bonus_channels_count)
+    updated_user = None
     if user_id:
-        await api.update_user(user_id, status="active")
+        updated_user = await api.update_user(user_id, status="active")
     
     # Clean up all training-related messages
-    await message_manager.delete_temporary(chat_id, tag="training_post_controls")
-    await message_manager.delete_temporary(chat_id, tag="bonus_nudge")
-    await message_manager.delete_temporary(chat_id, tag="miniapp_choice")
+    await asyncio.gather(
+        message_manager.delete_temporary(chat_id, tag="training_post_controls"),
+        message_manager.delete_temporary(chat_id, tag="bonus_nudge"),
+        message_manager.delete_temporary(chat_id, tag="miniapp_choice"),
+    )
     
     # Clear media cache for this chat to prevent late posts
     media_service = _get_media_service()
     await media_service.clear_cache(chat_id)
 
     # Get user language
-    lang = await _get_user_lang(user_id) if user_id else "en_US"
+    lang = await _lang_from_state(data)
     texts = get_texts(lang)
 
     user_has_bonus = False
     if user_id is not None:
-        user_data = await api.get_user(user_id)
-        if user_data:
-            user_has_bonus = user_data.get("bonus_channels_count", 0) >= 1
+        user_data = updated_user or await api.get_user(user_id) or EMPTY_USER
+        user_has_bonus = user_data.get("bonus_channels_count", 0) >= 1
 
+        # Persisted in Redis so a restart doesn't drop them (handlers are registered in main);
+        # scheduled in the background so a slow Redis doesn't hold up the menu below
+        delayed_jobs = get_delayed_jobs()
         # запустить нуджи по бонус-каналу
-        try:
-            asyncio.create_task(
-                _bonus_channel_nudge_watcher(chat_id, user_id, message_manager)
-            )
-        except Exception as e:
-            logger.error(f"Error starting bonus nudge watcher for user {user_id}: {e}")
-
+        fire_and_forget(delayed_jobs.schedule(
+            "bonus_nudge",
+            {"chat_id": chat_id, "user_id": user_id, "stage": 1},
+            _BONUS_NUDGE_DELAYS[0],
+        ))
         # отправить один лучший пост через минуту после обучения
-        async def delayed_best_post():
-            await asyncio.sleep(60)  # Wait 1 minute
-            try:
-                await send_initial_best_post(chat_id, user_id, message_manager)
-            except Exception as e:
-                logger.error(f"Error sending initial best post after training for user {user_id}: {e}")
-        
-        asyncio.create_task(delayed_best_post())
+        fire_and_forget(delayed_jobs.schedule(
+            "initial_best_post", {"chat_id": chat_id, "user_id": user_id}, 60
+        ))
 
     await state.clear()
 
     if is_retrain or is_bonus_training or user_has_bonus:
         # After retraining, bonus training, or if bonus already claimed – go straight to feed
-        logger.info(f"Sending feed_ready to chat_id={chat_id} (is_retrain={is_retrain}, is_bonus={is_bonus_training})")
+        logger.info("Sending feed_ready to chat_id=%s (is_retrain=%s, is_bonus=%s)", chat_id, is_retrain, is_bonus_training)
         await message_manager.send_system(
             chat_id,
             texts.get("feed_ready"),
@@ -581,14 +610,24 @@ async def finish_training_flow(chat_id: int, message_manager: MessageManager, st
             tag="menu",
         )
     else:
-        logger.info(f"Sending training_complete to chat_id={chat_id}, rated_count={rated_count}")
+        logger.info("Sending training_complete to chat_id=%s, rated_count=%s", chat_id, rated_count)
         await message_manager.send_system(
             chat_id,
             texts.get("training_complete", rated_count=rated_count),
             reply_markup=get_training_complete_keyboard(lang),
             tag="menu",
         )
-    logger.info(f"finish_training_flow completed for chat_id={chat_id}")
+    logger.info("finish_training_flow completed for chat_id=%s", chat_id)
+
+
+# Telegram rejects media groups with more than 10 items
+_ALBUM_LIMIT = 10
+_album_download_slots = asyncio.Semaphore(3)
+
+
+async def _download_album_photo(channel_username: str, media_id: int) -> bytes | None:
+    async with _album_download_slots:
+        return await get_user_bot().get_photo(channel_username, media_id)
 
 
 async def send_initial_best_post(
@@ -601,13 +640,11 @@ async def send_initial_best_post(
     Uses the same best-post logic as the feed, but triggers immediately after training
     to show the user value without requiring extra button presses.
     """
-    from aiogram.types import InputMediaPhoto, BufferedInputFile, LinkPreviewOptions
-    from bot.core import get_feed_post_keyboard
-    
     api = get_core_api()
     user_bot = get_user_bot()
 
-    await api.update_activity(user_id)
+    # Activity is bookkeeping only - don't hold the post for it
+    fire_and_forget(api.update_activity(user_id))
     user_data = await api.get_user(user_id)
     if not user_data:
         return
@@ -620,7 +657,8 @@ async def send_initial_best_post(
         # Already sent once, do not spam
         return
 
-    # Train ML model (mock) so relevance scores are available
+    # Train ML model (mock) so relevance scores are available;
+    # get_best_posts ranks by those scores, so it must wait for training
     result = await api.train_model(user_id)
     if not result or not result.get("success"):
         logger.warning(
@@ -633,28 +671,10 @@ async def send_initial_best_post(
     if not all_posts:
         return
 
-    now = datetime.utcnow()
-    three_days_ago = now - timedelta(days=3)
-
-    initial_best_post = None
-    for post in all_posts:
-        posted_at_raw = post.get("posted_at")
-        try:
-            posted_at = datetime.fromisoformat(posted_at_raw) if posted_at_raw else None
-            # Make offset-naive for comparison with utcnow()
-            if posted_at and posted_at.tzinfo is not None:
-                posted_at = posted_at.replace(tzinfo=None)
-        except Exception:
-            posted_at = None
-        if posted_at and posted_at >= three_days_ago:
-            initial_best_post = post
-            break
-
-    if not initial_best_post:
-        initial_best_post = all_posts[0]
+    initial_best_post = pick_initial_best_post(all_posts)
 
     # Send this post similarly to feed posts (with rating buttons)
-    channel_title = html.escape(initial_best_post.get("channel_title", "Unknown"))
+    channel_title = escape_channel_title(initial_best_post.get("channel_title", "Unknown"))
     channel_username = (initial_best_post.get("channel_username") or "").lstrip("@")
     msg_id = initial_best_post.get("telegram_message_id")
     
@@ -667,36 +687,27 @@ async def send_initial_best_post(
 
     # Build header with link to original post (HTML format)
     if channel_username and msg_id:
-        header = f"📰 <a href=\"https://t.me/{channel_username}/{msg_id}\">{channel_title}</a>\n\n"
+        header = POST_HEADER_LINK_TPL.format(
+            username=channel_username, message_id=msg_id, title=channel_title
+        )
     else:
-        header = f"📰 <b>{channel_title}</b>\n\n"
-    body = text if text else "<i>[Media content]</i>"
+        header = POST_HEADER_TITLE_TPL.format(title=channel_title)
+    body = text if text else MEDIA_PLACEHOLDER
     post_text = header + body
 
     # Telegram counts caption length without HTML tags
-    from bot.utils import get_html_text_length
-    caption_fits = get_html_text_length(post_text) <= TELEGRAM_CAPTION_LIMIT
+    caption_fits = fits_in_caption(post_text)
     sent_with_caption = False
 
     if initial_best_post.get("media_type") == "photo":
         channel_username = initial_best_post.get("channel_username")
-        media_ids_str = initial_best_post.get("media_file_id") or ""
-
-        media_ids: list[int] = []
-        if media_ids_str:
-            for part in media_ids_str.split(","):
-                part = part.strip()
-                if part.isdigit():
-                    media_ids.append(int(part))
-        else:
-            msg_id = initial_best_post.get("telegram_message_id")
-            if isinstance(msg_id, int):
-                media_ids.append(msg_id)
+        media_ids = parse_media_ids(initial_best_post)
 
         if channel_username and media_ids:
             if len(media_ids) > 1:
-                # Download all photos in parallel
-                tasks = [user_bot.get_photo(channel_username, mid) for mid in media_ids]
+                # Telegram albums hold at most 10 items; download a few at a time
+                media_ids = media_ids[:_ALBUM_LIMIT]
+                tasks = [_download_album_photo(channel_username, mid) for mid in media_ids]
                 results = await asyncio.gather(*tasks, return_exceptions=True)
                 
                 media_items: list[InputMediaPhoto] = []
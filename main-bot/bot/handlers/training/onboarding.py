@@ -3,6 +3,7 @@
 import json
 import logging
 import asyncio
+from random import sample
 
 from aiogram import Router, F
 from aiogram.types import CallbackQuery, Message, InlineKeyboardMarkup, InlineKeyboardButton, WebAppInfo
@@ -16,7 +17,8 @@ from bot.core import (
 from bot.core.states import TrainingStates
 from bot.services import get_core_api, get_user_bot
 import html
-from .helpers import _get_user_lang, _start_training_session, finish_training_flow
+from bot.utils import single_flight, fire_and_forget, parse_channel_username
+from .helpers import _get_user_lang, _scrape_with_timeout, _start_training_session, finish_training_flow
 
 logger = logging.getLogger(__name__)
 router = Router()
@@ -33,21 +35,21 @@ async def on_web_app_data(
     try:
         data = json.loads(message.web_app_data.data)
     except json.JSONDecodeError:
-        logger.error(f"Invalid JSON from web_app_data: {message.web_app_data.data}")
+        logger.error("Invalid JSON from web_app_data: %s", message.web_app_data.data)
         return
     
     action = data.get("action")
     user_id = message.from_user.id
     chat_id = message.chat.id
     
-    logger.info(f"Received web_app_data from user {user_id}: action={action}")
+    logger.info("Received web_app_data from user %s: action=%s", user_id, action)
     
     api = get_core_api()
     await api.update_activity(user_id)
     
     if action == "training_complete":
         rated_count = data.get("rated_count", 0)
-        await api.create_log(user_id, "miniapp_training_complete", f"rated_count={rated_count}")
+        fire_and_forget(api.create_log(user_id, "miniapp_training_complete", f"rated_count={rated_count}"))
         
         existing_state = await state.get_data()
         is_bonus_training = existing_state.get("is_bonus_training", False)
@@ -68,13 +70,14 @@ async def on_web_app_data(
         
         if post_id and interaction_type and interaction_type != "skip":
             await api.create_interaction(user_id, post_id, interaction_type)
-            await api.create_log(user_id, f"miniapp_post_{interaction_type}", f"post_id={post_id}")
+            fire_and_forget(api.create_log(user_id, f"miniapp_post_{interaction_type}", f"post_id={post_id}"))
     
     else:
-        logger.warning(f"Unknown web_app_data action: {action}")
+        logger.warning("Unknown web_app_data action: %s", action)
 
 
 @router.callback_query(F.data == "start_training")
+@single_flight
 async def on_start_training(
     callback: CallbackQuery,
     message_manager: MessageManager
@@ -82,24 +85,22 @@ async def on_start_training(
     """Handle Start Training button - scrape posts and show MiniApp/chat choice."""
     await message_manager.send_toast(callback)
     api = get_core_api()
-    user_bot = get_user_bot()
     user_id = callback.from_user.id
     await api.update_activity(user_id)
-    await api.create_log(user_id, "start_training_clicked")
+    fire_and_forget(api.create_log(user_id, "start_training_clicked"))
     
     lang = await _get_user_lang(user_id)
     texts = get_texts(lang)
     
     try:
-        await callback.message.edit_text(texts.get("fetching_posts"))
+        await message_manager.edit_message(callback.message, texts.get("fetching_posts"))
     except Exception:
         pass
     
-    default_channels = settings.default_training_channels.split(",")
     # Use set to avoid duplicates
     channels_set = set()
-    for ch in default_channels:
-        ch_clean = ch.strip().lstrip("@").lower()
+    for ch in settings.default_training_channels_list:
+        ch_clean = ch.lstrip("@").lower()
         if ch_clean:
             channels_set.add(ch_clean)
     
@@ -111,15 +112,13 @@ async def on_start_training(
     
     channels_to_scrape = [f"@{ch}" for ch in channels_set]
     
-    scrape_tasks = []
-    for channel in channels_to_scrape[:3]:
-        task = user_bot.scrape_channel(channel, limit=settings.posts_per_channel)
-        scrape_tasks.append(task)
-    
-    await asyncio.gather(*scrape_tasks, return_exceptions=True)
+    async with asyncio.TaskGroup() as tg:
+        for channel in channels_to_scrape[:3]:
+            tg.create_task(_scrape_with_timeout(channel, settings.posts_per_channel))
     
     try:
-        await callback.message.edit_text(
+        await message_manager.edit_message(
+            callback.message,
             texts.get("training_intro"),
             reply_markup=get_onboarding_keyboard(lang, user_id, channels_to_scrape[:3]),
         )
@@ -146,6 +145,7 @@ async def on_how_it_works(
 
 
 @router.callback_query(F.data == "confirm_training")
+@single_flight
 async def on_confirm_training(
     callback: CallbackQuery,
     message_manager: MessageManager,
@@ -157,11 +157,12 @@ async def on_confirm_training(
     user_bot = get_user_bot()
     user_id = callback.from_user.id
     
-    await api.update_activity(user_id)
-    await api.update_user(user_id, status="training")
-    await api.create_log(user_id, "training_started")
-    
-    lang = await _get_user_lang(user_id)
+    fire_and_forget(api.create_log(user_id, "training_started"))
+    _, _, lang = await asyncio.gather(
+        api.update_activity(user_id),
+        api.update_user(user_id, status="training"),
+        _get_user_lang(user_id),
+    )
     texts = get_texts(lang)
     await message_manager.send_system(
         callback.message.chat.id,
@@ -170,21 +171,21 @@ async def on_confirm_training(
     )
     
     # Build list of channels to use for training (defaults + user channels)
-    default_channels = settings.default_training_channels.split(",")
-    channels_to_use = [ch.strip() for ch in default_channels if ch.strip()]
+    channels_to_use = list(settings.default_training_channels_list)
     
     # Add default channels to user's channel list if not already added
     # This ensures users keep their training channels even if defaults change in .env
-    for default_channel in default_channels:
-        channel_username = default_channel.strip().lstrip("@")
-        if channel_username:
-            # Try to add as training channel (will be ignored if already exists)
-            await api.channels.add_user_channel(
-                user_id,
-                channel_username,
-                is_for_training=True,
-                is_bonus=False
-            )
+    # (already existing ones are ignored by the API, so order doesn't matter)
+    await asyncio.gather(*(
+        api.channels.add_user_channel(
+            user_id,
+            channel.lstrip("@"),
+            is_for_training=True,
+            is_bonus=False
+        )
+        for channel in channels_to_use
+        if channel.lstrip("@")
+    ))
     
     user_channels = await api.get_user_channels(user_id)
     for ch in user_channels:
@@ -199,8 +200,6 @@ async def on_confirm_training(
     )
     
     if not posts:
-        lang = await _get_user_lang(user_id)
-        texts = get_texts(lang)
         await message_manager.send_system(
             callback.message.chat.id,
             texts.get("no_posts_training"),
@@ -215,7 +214,6 @@ async def on_confirm_training(
         + settings.training_max_extra_from_dislike
         + settings.training_max_extra_from_skip
     )
-    from random import sample
     pool_size = min(len(posts), settings.training_recent_posts_per_channel, max_pool_size)
     training_posts = sample(posts, pool_size) if len(posts) > pool_size else posts
     
@@ -230,6 +228,7 @@ async def on_confirm_training(
         skips_count=0,
         extra_from_dislike_used=0,
         extra_from_skip_used=0,
+        lang=lang,
     )
     await state.set_state(TrainingStates.rating_posts)
     
@@ -250,7 +249,8 @@ async def on_add_channel(
     texts = get_texts(lang)
     
     try:
-        await callback.message.edit_text(
+        await message_manager.edit_message(
+            callback.message,
             texts.get("add_channel_prompt"),
             reply_markup=get_add_channel_keyboard(lang),
         )
@@ -265,7 +265,7 @@ async def on_channel_input(
     state: FSMContext
 ):
     """Handle channel username input."""
-    channel_input = message.text.strip()
+    username = parse_channel_username(message.text or "")
     api = get_core_api()
     user_bot = get_user_bot()
     user_id = message.from_user.id
@@ -277,7 +277,7 @@ async def on_channel_input(
     # Delete user's message
     await message_manager.delete_user_message(message)
     
-    if not channel_input.startswith("@") and not channel_input.startswith("https://t.me/"):
+    if not username:
         await message_manager.send_temporary(
             message.chat.id,
             texts.get("invalid_channel_username"),
@@ -285,11 +285,6 @@ async def on_channel_input(
         )
         return
     
-    if channel_input.startswith("https://t.me/"):
-        username = "@" + channel_input.split("/")[-1]
-    else:
-        username = channel_input
-    
     await message_manager.send_temporary(
         message.chat.id,
         texts.get("checking_channel", username=username),
@@ -301,11 +296,11 @@ async def on_channel_input(
     if join_result and join_result.get("success"):
         await user_bot.scrape_channel(username, limit=settings.posts_per_channel)
         await api.add_user_channel(user_id, username, is_for_training=True)
-        await api.create_log(user_id, "channel_added", username)
+        fire_and_forget(api.create_log(user_id, "channel_added", username))
         
-        await message_manager.delete_temporary(message.chat.id, tag="loading")
-        await message_manager.send_temporary(
+        await message_manager.replace_temporary(
             message.chat.id,
+            "loading",
             texts.get("channel_added", username=username),
             auto_delete_after=3.0
         )
@@ -318,9 +313,9 @@ async def on_channel_input(
             tag="menu"
         )
     else:
-        await message_manager.delete_temporary(message.chat.id, tag="loading")
-        await message_manager.send_temporary(
+        await message_manager.replace_temporary(
             message.chat.id,
+            "loading",
             texts.get("cannot_access_channel", username=username),
             auto_delete_after=5.0
         )
@@ -340,7 +335,8 @@ async def on_skip_add_channel(
     texts = get_texts(lang)
     
     try:
-        await callback.message.edit_text(
+        await message_manager.edit_message(
+            callback.message,
             texts.get("training_intro"),
             reply_markup=get_onboarding_keyboard(lang),
         )
@@ -367,22 +363,11 @@ async def on_back_to_start(
     texts = get_texts(lang)
     name = html.escape(callback.from_user.first_name or "there")
     
-    # Use edit_system to ensure temporary messages are deleted
-    from bot.core import get_start_keyboard
-    success = await message_manager.edit_system(
+    await message_manager.show_menu(
         callback.message.chat.id,
         texts.get("welcome", name=name),
-        reply_markup=get_start_keyboard(lang),
-        tag="menu"
+        reply_markup=get_start_keyboard(lang)
     )
-    if not success:
-        # Fallback to send_system if edit fails
-        await message_manager.send_system(
-            callback.message.chat.id,
-            texts.get("welcome", name=name),
-            reply_markup=get_start_keyboard(lang),
-            tag="menu"
-        )
 
 
 @router.callback_query(F.data == "back_to_onboarding")
@@ -399,7 +384,8 @@ async def on_back_to_onboarding(
     texts = get_texts(lang)
     
     try:
-        await callback.message.edit_text(
+        await message_manager.edit_message(
+            callback.message,
             texts.get("training_intro"),
             reply_markup=get_onboarding_keyboard(lang),
         )
@@ -1,25 +1,37 @@
 """Rating handlers for training flow."""
 
+import asyncio
 import logging
+from random import choice
 
 from aiogram import Router, F
-from aiogram.types import CallbackQuery
+from aiogram.types import CallbackQuery, ReactionTypeEmoji
 from aiogram.fsm.context import FSMContext
 
-from bot.core import MessageManager
+from bot.core import MessageManager, RatePostCallback, get_settings
 from bot.services import get_core_api
+from bot.utils import TTLSet, single_flight, fire_and_forget
 from .helpers import _get_user_lang, show_training_post, finish_training_flow
 
 logger = logging.getLogger(__name__)
 router = Router()
+settings = get_settings()
 
 # Track processed callbacks to prevent double-click
-_processed_rate_callbacks: set = set()
+_processed_rate_callbacks = TTLSet(max_size=4096, ttl=10.0)
 
+# Reaction payloads per rating action, built once
+_REACTIONS = {
+    "like": [ReactionTypeEmoji(emoji="👍")],
+    "dislike": [ReactionTypeEmoji(emoji="👎")],
+    "skip": [ReactionTypeEmoji(emoji="⏭️")],
+}
 
-@router.callback_query(F.data.startswith("rate:"))
+
+@router.callback_query(RatePostCallback.filter())
 async def on_rate_post(
     callback: CallbackQuery,
+    callback_data: RatePostCallback,
     message_manager: MessageManager,
     state: FSMContext
 ):
@@ -30,11 +42,8 @@ async def on_rate_post(
         return
     _processed_rate_callbacks.add(callback_key)
     
-    if len(_processed_rate_callbacks) > 100:
-        _processed_rate_callbacks.clear()
-    
-    _, action, post_id = callback.data.split(":")
-    post_id = int(post_id)
+    action = callback_data.action
+    post_id = callback_data.post_id
     
     await message_manager.send_toast(
         callback, 
@@ -44,32 +53,29 @@ async def on_rate_post(
     api = get_core_api()
     user_id = callback.from_user.id
     
-    await api.update_activity(user_id)
+    # Activity is bookkeeping only - don't hold the next post for it
+    fire_and_forget(api.update_activity(user_id))
     
     data = await state.get_data()
     
-    # Set reaction on the regular post message
-    post_message_id = data.get("current_post_message_id")
-    if post_message_id:
-        reaction_emoji = "👍" if action == "like" else "👎" if action == "dislike" else "⏭️" if action == "skip" else None
-        if reaction_emoji:
-            try:
-                from aiogram.types import ReactionTypeEmoji
-                await message_manager.bot.set_message_reaction(
-                    chat_id=callback.message.chat.id,
-                    message_id=post_message_id,
-                    reaction=[ReactionTypeEmoji(emoji=reaction_emoji)]
-                )
-            except Exception as e:
-                logger.warning(f"Failed to set reaction on post message: {e}")
-    
     # Delete temporary message with controls (post content is regular message, stays)
-    await message_manager.delete_temporary(callback.message.chat.id, tag="training_post_controls")
+    # and set the reaction on the regular post message at the same time
+    cleanup = [message_manager.delete_temporary(callback.message.chat.id, tag="training_post_controls")]
+    post_message_id = data.get("current_post_message_id")
+    reaction = _REACTIONS.get(action)
+    if post_message_id and reaction:
+        cleanup.append(
+            message_manager.bot.set_message_reaction(
+                chat_id=callback.message.chat.id,
+                message_id=post_message_id,
+                reaction=reaction
+            )
+        )
+    for result in await asyncio.gather(*cleanup, return_exceptions=True):
+        if isinstance(result, Exception):
+            logger.warning("Failed to clean up rated post: %s", result)
     
     # N-логика очереди и буфера взаимодействий
-    from random import choice
-    from bot.core import get_settings
-    settings = get_settings()
     
     training_posts = data.get("training_posts", [])
     queue = data.get("training_queue", [])
@@ -124,7 +130,7 @@ async def on_rate_post(
         return
     
     # Обновляем стейт и показываем следующий пост
-    await state.update_data(
+    data = await state.update_data(
         training_queue=queue,
         likes_count=likes_count,
         dislikes_count=dislikes_count,
@@ -135,10 +141,11 @@ async def on_rate_post(
         current_post_message_id=None,
     )
     
-    await show_training_post(callback.message.chat.id, message_manager, state)
+    await show_training_post(callback.message.chat.id, message_manager, state, data)
 
 
 @router.callback_query(F.data == "finish_training")
+@single_flight
 async def on_finish_training(
     callback: CallbackQuery,
     message_manager: MessageManager,
@@ -2,21 +2,33 @@
 
 import logging
 import asyncio
+import time
 from datetime import datetime
 
 from aiogram import Router, F
-from aiogram.types import CallbackQuery, InlineKeyboardMarkup, InlineKeyboardButton, WebAppInfo
+from aiogram.types import CallbackQuery
 from aiogram.fsm.context import FSMContext
 
-from bot.core import MessageManager, get_texts, get_settings
+from bot.core import (
+    MessageManager, get_texts, get_settings,
+    get_retrain_keyboard, get_feed_keyboard, get_bonus_training_keyboard,
+)
 from bot.core.states import TrainingStates
 from bot.services import get_core_api, get_user_bot
-from .helpers import _get_user_lang, _start_training_session
+from bot.utils import single_flight, fire_and_forget
+from .helpers import _get_user_lang, _scrape_with_timeout, _start_training_session
 
 logger = logging.getLogger(__name__)
 router = Router()
 settings = get_settings()
 
+# Bonus channel scrapes started by start_bonus_training, keyed by user id
+_pending_bonus_scrapes: dict[int, asyncio.Task] = {}
+# How long chat-mode bonus training waits for a still-running scrape
+_BONUS_SCRAPE_WAIT = 30.0
+# How long the channel list stored by start_full_retrain is trusted by on_confirm_retrain
+_RETRAIN_CHANNELS_TTL = 60.0
+
 
 async def start_full_retrain(
     chat_id: int,
@@ -26,12 +38,12 @@ async def start_full_retrain(
 ):
     """Start a new full retraining session using user's current channels."""
     api = get_core_api()
-    user_bot = get_user_bot()
 
-    await api.update_activity(user_id)
-    await api.update_user(user_id, status="training")
-
-    lang = await _get_user_lang(user_id)
+    _, _, lang = await asyncio.gather(
+        api.update_activity(user_id),
+        api.update_user(user_id, status="training"),
+        _get_user_lang(user_id),
+    )
     texts = get_texts(lang)
 
     await message_manager.send_system(
@@ -40,18 +52,18 @@ async def start_full_retrain(
         tag="menu",
     )
 
-    default_channels = settings.default_training_channels.split(",")
+    default_channels = settings.default_training_channels_list
     # Use set to avoid duplicates
     channels_set = set()
     for ch in default_channels:
-        ch_clean = ch.strip().lstrip("@").lower()
+        ch_clean = ch.lstrip("@").lower()
         if ch_clean:
             channels_set.add(ch_clean)
 
     # Add default channels to user's channel list if not already added
     # This ensures users keep their training channels even if defaults change in .env
     for default_channel in default_channels:
-        channel_username = default_channel.strip().lstrip("@")
+        channel_username = default_channel.lstrip("@")
         if channel_username:
             # Try to add as training channel (will be ignored if already exists)
             await api.channels.add_user_channel(
@@ -69,21 +81,21 @@ async def start_full_retrain(
     
     channels_to_scrape = [f"@{ch}" for ch in channels_set]
 
-    scrape_tasks = []
-    for channel in channels_to_scrape[:3]:
-        scrape_tasks.append(user_bot.scrape_channel(channel, limit=settings.posts_per_channel))
-
-    await asyncio.gather(*scrape_tasks, return_exceptions=True)
+    async with asyncio.TaskGroup() as tg:
+        for channel in channels_to_scrape[:3]:
+            tg.create_task(_scrape_with_timeout(channel, settings.posts_per_channel))
 
     await state.update_data(
         user_id=user_id,
         is_retrain=True,
+        # on_confirm_retrain reuses these instead of fetching them again
+        retrain_channels=[ch["username"] for ch in user_channels if ch.get("username")],
+        retrain_channels_at=time.time(),
     )
 
-    from bot.core import get_retrain_keyboard
     await message_manager.send_system(
         chat_id,
-        texts.get("retrain_intro", default="🔄 Переобучение модели"),
+        texts.get("retrain_intro"),
         reply_markup=get_retrain_keyboard(lang, user_id, channels_to_scrape[:3]),
         tag="menu",
     )
@@ -100,11 +112,12 @@ async def start_bonus_training(
     api = get_core_api()
     user_bot = get_user_bot()
 
-    await api.update_activity(user_id)
-    await api.create_log(user_id, "bonus_training_started", username)
-    await api.update_user(user_id, status="training")
-
-    lang = await _get_user_lang(user_id)
+    fire_and_forget(api.create_log(user_id, "bonus_training_started", username))
+    _, _, lang = await asyncio.gather(
+        api.update_activity(user_id),
+        api.update_user(user_id, status="training"),
+        _get_user_lang(user_id),
+    )
     texts = get_texts(lang)
 
     await message_manager.send_system(
@@ -113,32 +126,28 @@ async def start_bonus_training(
         tag="menu",
     )
 
-    try:
-        await user_bot.scrape_channel(username, limit=settings.posts_per_channel)
-    except Exception:
-        pass
+    # Don't hold the intro screen on the scrape; chat-mode training waits for it
+    scrape_task = fire_and_forget(user_bot.scrape_channel(username, limit=settings.posts_per_channel))
+    _pending_bonus_scrapes[user_id] = scrape_task
+    scrape_task.add_done_callback(
+        lambda t: _pending_bonus_scrapes.pop(user_id, None) if _pending_bonus_scrapes.get(user_id) is t else None
+    )
 
     await state.update_data(
         bonus_channel_username=username,
         is_bonus_training=True,
     )
 
-    url = f"{settings.miniapp_url}?user_id={user_id}&channel={username.lstrip('@')}"
-
-    keyboard = InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(text=texts.get("miniapp_btn_open"), web_app=WebAppInfo(url=url))],
-        [InlineKeyboardButton(text=texts.get("miniapp_btn_rate_in_chat"), callback_data=f"confirm_bonus_training:{username}")],
-    ])
-
     await message_manager.send_system(
         chat_id,
         texts.get("bonus_training_intro", username=username),
-        reply_markup=keyboard,
+        reply_markup=get_bonus_training_keyboard(lang, user_id, username),
         tag="menu",
     )
 
 
 @router.callback_query(F.data.startswith("confirm_bonus_training:"))
+@single_flight
 async def on_confirm_bonus_training(
     callback: CallbackQuery,
     message_manager: MessageManager,
@@ -146,7 +155,7 @@ async def on_confirm_bonus_training(
 ):
     """Start bonus training in chat mode."""
     await message_manager.send_toast(callback)
-    username = callback.data.split(":", 1)[1]
+    username = callback.data.partition(":")[2]
     user_id = callback.from_user.id
     chat_id = callback.message.chat.id
     api = get_core_api()
@@ -156,6 +165,14 @@ async def on_confirm_bonus_training(
 
     channels_to_scrape = [username]
 
+    scrape_task = _pending_bonus_scrapes.pop(user_id, None)
+    if scrape_task is not None:
+        try:
+            await asyncio.wait_for(asyncio.shield(scrape_task), timeout=_BONUS_SCRAPE_WAIT)
+        except Exception:
+            # Timed out or failed - use whatever posts have landed so far
+            pass
+
     posts = await api.get_training_posts(
         user_id,
         channels_to_scrape,
@@ -164,7 +181,6 @@ async def on_confirm_bonus_training(
 
     if not posts:
         await state.clear()
-        from bot.core import get_feed_keyboard
         await message_manager.send_system(
             chat_id,
             texts.get("bonus_training_no_posts", username=username),
@@ -180,6 +196,7 @@ async def on_confirm_bonus_training(
         rated_count=0,
         last_media_ids=[],
         is_bonus_training=True,
+        lang=lang,
     )
     await state.set_state(TrainingStates.rating_posts)
 
@@ -187,6 +204,7 @@ async def on_confirm_bonus_training(
 
 
 @router.callback_query(F.data == "confirm_retrain")
+@single_flight
 async def on_confirm_retrain(
     callback: CallbackQuery,
     message_manager: MessageManager,
@@ -202,26 +220,29 @@ async def on_confirm_retrain(
     lang = await _get_user_lang(user_id)
     texts = get_texts(lang)
 
-    default_channels = settings.default_training_channels.split(",")
-    channels_to_scrape = [ch.strip() for ch in default_channels]
-
-    # Add default channels to user's channel list if not already added
-    # This ensures users keep their training channels even if defaults change in .env
-    for default_channel in default_channels:
-        channel_username = default_channel.strip().lstrip("@")
-        if channel_username:
-            # Try to add as training channel (will be ignored if already exists)
-            await api.channels.add_user_channel(
-                user_id,
-                channel_username,
-                is_for_training=True,
-                is_bonus=False
-            )
-
-    user_channels = await api.get_user_channels(user_id)
-    for ch in user_channels:
-        if ch.get("username"):
-            channels_to_scrape.append(f"@{ch['username']}")
+    default_channels = settings.default_training_channels_list
+    channels_to_scrape = list(default_channels)
+
+    # start_full_retrain already added the defaults and fetched the user's channels
+    data = await state.get_data()
+    user_channel_names = data.get("retrain_channels")
+    if user_channel_names is None or time.time() - data.get("retrain_channels_at", 0) > _RETRAIN_CHANNELS_TTL:
+        # Add default channels to user's channel list if not already added
+        # This ensures users keep their training channels even if defaults change in .env
+        for default_channel in default_channels:
+            channel_username = default_channel.lstrip("@")
+            if channel_username:
+                # Try to add as training channel (will be ignored if already exists)
+                await api.channels.add_user_channel(
+                    user_id,
+                    channel_username,
+                    is_for_training=True,
+                    is_bonus=False
+                )
+
+        user_channels = await api.get_user_channels(user_id)
+        user_channel_names = [ch["username"] for ch in user_channels if ch.get("username")]
+    channels_to_scrape.extend(f"@{name}" for name in user_channel_names)
 
     posts = await api.get_training_posts(
         user_id,
@@ -245,6 +266,7 @@ async def on_confirm_retrain(
         rated_count=0,
         last_media_ids=[],
         is_retrain=True,
+        lang=lang,
     )
     await state.set_state(TrainingStates.rating_posts)
 
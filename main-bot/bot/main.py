@@ -11,12 +11,15 @@ from aiogram.enums import ParseMode
 from aiogram.fsm.storage.memory import MemoryStorage
 
 from bot.core import get_settings, setup_logging, get_logger, MessageManager
-from bot.core.middleware import MessageManagerMiddleware, AutoDeleteUserMessagesMiddleware
+from bot.core.middleware import (
+    MessageManagerMiddleware, AutoDeleteUserMessagesMiddleware, RateLimitRequestMiddleware,
+)
 from bot.services import close_clients
 from bot.handlers import commands
 from bot.handlers.training import router as training_router
 from bot.handlers.feed import router as feed_router
 from bot.redis_subscriber import RedisSubscriber
+from bot.delayed_jobs import get_delayed_jobs
 
 # Configure logging
 setup_logging(
@@ -59,6 +62,8 @@ async def main():
         token=settings.telegram_bot_token,
         default=DefaultBotProperties(parse_mode=ParseMode.HTML)
     )
+    # Pace all outgoing API calls to stay under Telegram's flood limits
+    bot.session.middleware(RateLimitRequestMiddleware())
     
     # Initialize dispatcher with memory storage
     # In production, use Redis storage for persistence
@@ -158,6 +163,19 @@ async def main():
         except Exception as e:
             logger.error(f"Error handling new_post: {e}", exc_info=True)
     
+    # Delayed jobs scheduled from training (persisted in Redis)
+    async def handle_initial_best_post(data: dict):
+        from bot.handlers.training.helpers import send_initial_best_post
+        await send_initial_best_post(data["chat_id"], data["user_id"], message_manager)
+    
+    async def handle_bonus_nudge(data: dict):
+        from bot.handlers.training.helpers import send_bonus_channel_nudge
+        await send_bonus_channel_nudge(data["chat_id"], data["user_id"], data["stage"], message_manager)
+    
+    delayed_jobs = get_delayed_jobs()
+    delayed_jobs.register_handler("initial_best_post", handle_initial_best_post)
+    delayed_jobs.register_handler("bonus_nudge", handle_bonus_nudge)
+    
     # Startup event
     async def on_startup():
         global heartbeat_task, redis_subscriber
@@ -171,6 +189,8 @@ async def main():
         redis_subscriber.register_handler("ppp:training_complete", handle_training_complete)
         redis_subscriber.register_handler("ppp:new_posts", handle_new_post)
         await redis_subscriber.start()
+        # Start delayed job poller
+        await delayed_jobs.start()
         # Set bot commands
         from aiogram.types import BotCommand
         await bot.set_my_commands([
@@ -188,6 +208,7 @@ async def main():
         # Stop Redis subscriber
         if redis_subscriber:
             await redis_subscriber.stop()
+        await delayed_jobs.stop()
         # Stop heartbeat
         if heartbeat_task:
             heartbeat_task.cancel()
@@ -11,8 +11,9 @@ from datetime import datetime, timedelta
 from typing import Optional, Set
 from aiogram import Bot
 
-import html
 from bot.services import get_core_api, get_user_bot
+from bot.services.media_service import media_file_ids
+from bot.utils import escape_channel_title
 from bot.core.message_manager import MessageManager
 from bot.core import get_feed_post_keyboard
 
@@ -107,9 +108,9 @@ class RealtimeFeedService:
                 first_msg_id = msg_id
                 if media_file_id and "," in str(media_file_id):
                     first_msg_id = media_file_id.split(",")[0]
-                header = f'🆕 <a href="https://t.me/{channel_username}/{first_msg_id}">{html.escape(channel_title)}</a>\n\n'
+                header = f'🆕 <a href="https://t.me/{channel_username}/{first_msg_id}">{escape_channel_title(channel_title)}</a>\n\n'
             else:
-                header = f"🆕 {html.escape(channel_title)}\n\n"
+                header = f"🆕 {escape_channel_title(channel_title)}\n\n"
             
             full_text = header + text
             
@@ -149,18 +150,24 @@ class RealtimeFeedService:
     ):
         """Send a post with a single photo, buttons as separate message."""
         try:
-            user_bot = get_user_bot()
-            photo_bytes = await user_bot.get_photo(channel_username, msg_id)
+            file_id = media_file_ids.get(channel_username, int(msg_id))
+            photo_bytes = None
+            if not file_id:
+                user_bot = get_user_bot()
+                photo_bytes = await user_bot.get_photo(channel_username, msg_id)
             
-            if photo_bytes:
-                # Send photo without buttons
-                await self.message_manager.send_regular(
+            if file_id or photo_bytes:
+                # Send photo without buttons; reuse the uploaded file for other users
+                sent = await self.message_manager.send_regular(
                     chat_id=user_id,
                     text=text[:1024],  # Caption limit
+                    photo=file_id,
                     photo_bytes=photo_bytes,
                     photo_filename=f"{msg_id}.jpg",
                     tag="realtime_post"
                 )
+                if not file_id:
+                    media_file_ids.remember(channel_username, int(msg_id), sent)
                 # Send buttons as separate message
                 await self.message_manager.send_regular(
                     chat_id=user_id,
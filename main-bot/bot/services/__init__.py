@@ -2,6 +2,7 @@
 
 from bot.services.api_service import (
     CoreAPIClient,
+    EMPTY_USER,
     UserBotClient,
     PostCacheClient,
     get_core_api,
@@ -12,6 +13,7 @@ from bot.services.api_service import (
 
 __all__ = [
     "CoreAPIClient",
+    "EMPTY_USER",
     "UserBotClient",
     "PostCacheClient",
     "get_core_api",
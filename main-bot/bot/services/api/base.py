@@ -11,16 +11,28 @@ settings = get_settings()
 T = TypeVar('T')
 
 
+# Keep-alive pool sized for concurrent handlers hitting the same host
+API_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=60.0)
+
+
+def create_api_http_client() -> httpx.AsyncClient:
+    """Create a pooled HTTP client for the api service."""
+    return httpx.AsyncClient(timeout=30.0, limits=API_LIMITS)
+
+
 class BaseAPIClient:
     """Base client for API service with common HTTP client."""
     
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         self.base_url = settings.core_api_url.rstrip("/")
-        self.client = httpx.AsyncClient(timeout=30.0)
+        # A shared client is owned (and closed) by whoever created it
+        self._owns_client = client is None
+        self.client = client or create_api_http_client()
     
     async def close(self):
         """Close HTTP client."""
-        await self.client.aclose()
+        if self._owns_client:
+            await self.client.aclose()
     
     async def _handle_request(
         self,
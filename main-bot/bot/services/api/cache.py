@@ -0,0 +1,85 @@
+"""In-process TTL caches for hot, rarely changing API responses."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+
+class TTLCache:
+    """Size-bounded cache whose entries expire after a fixed TTL.
+
+    Not shared between processes: every write path that changes the
+    cached data on the API side must call invalidate() for its key.
+    """
+
+    def __init__(self, ttl: float, max_size: int = 10000):
+        self._ttl = ttl
+        self._max_size = max_size
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return cached value or None if missing/expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value, evicting the oldest entries above max_size."""
+        self._data[key] = (time.monotonic() + self._ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._max_size:
+            self._data.popitem(last=False)
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Return cached value or await loader(), sharing one call between concurrent misses.
+
+        A None result is returned but not cached.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, loader))
+            self._inflight[key] = task
+        # One cancelled caller must not cancel the load for the others
+        return await asyncio.shield(task)
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        this = asyncio.current_task()
+        try:
+            value = await loader()
+            # invalidate() during the request means the value may be stale
+            if value is not None and self._inflight.get(key) is this:
+                self.set(key, value)
+            return value
+        finally:
+            if self._inflight.get(key) is this:
+                del self._inflight[key]
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop cached value for key (and detach any in-flight load)."""
+        self._data.pop(key, None)
+        self._inflight.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached values."""
+        self._data.clear()
+        self._inflight.clear()
+
+
+# Language only changes through set_user_language / get_or_create_user
+user_language_cache = TTLCache(ttl=3600)
+# User rows change server-side too (training, channels), keep this short
+user_cache = TTLCache(ttl=30)
+# Channel lists only change through add_user_channel from this bot
+user_channels_cache = TTLCache(ttl=10)
+# Channels scraped in the last minute; repeat scrapes from other flows/users are skipped
+recent_scrapes = TTLCache(ttl=60)
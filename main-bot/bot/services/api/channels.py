@@ -1,8 +1,9 @@
 """Channel service for API interactions."""
 
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from .base import BaseAPIClient
+from .cache import user_cache, user_channels_cache
 
 logger = logging.getLogger(__name__)
 
@@ -40,22 +41,28 @@ class ChannelService(BaseAPIClient):
                     "is_bonus": is_bonus,
                 }
             )
+            user_cache.invalidate(telegram_id)
+            user_channels_cache.invalidate(telegram_id)
             return response.status_code == 201
         except Exception as e:
             logger.error(f"Error adding user channel: {e}")
             return False
     
     async def get_user_channels(self, telegram_id: int) -> List[Dict[str, Any]]:
-        """Get all channels for a user."""
-        try:
-            response = await self.client.get(
-                f"{self.base_url}/api/v1/channels/user/{telegram_id}"
-            )
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Error getting user channels: {e}")
-            return []
+        """Get all channels for a user (cached briefly)."""
+        async def load() -> Optional[List[Dict[str, Any]]]:
+            try:
+                response = await self.client.get(
+                    f"{self.base_url}/api/v1/channels/user/{telegram_id}"
+                )
+                response.raise_for_status()
+                return response.json()
+            except Exception as e:
+                logger.error(f"Error getting user channels: {e}")
+                return None
+        
+        channels = await user_channels_cache.get_or_load(telegram_id, load)
+        return channels if channels is not None else []
     
     async def get_users_by_channel(self, channel_username: str) -> List[Dict[str, Any]]:
         """Get all users subscribed to a channel."""
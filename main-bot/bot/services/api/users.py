@@ -1,11 +1,16 @@
 """User service for API interactions."""
 
+import asyncio
 import logging
 from typing import Optional, List, Dict, Any
 from .base import BaseAPIClient
+from .cache import user_cache, user_language_cache
 
 logger = logging.getLogger(__name__)
 
+# Activity updates currently being sent, keyed by user id
+_activity_inflight: dict[int, asyncio.Task] = {}
+
 
 class UserService(BaseAPIClient):
     """Service for user-related API endpoints."""
@@ -52,17 +57,22 @@ class UserService(BaseAPIClient):
                 json=json_data
             )
             response.raise_for_status()
+            user_cache.invalidate(telegram_id)
+            user_language_cache.invalidate(telegram_id)
             return response.json()
         except Exception as e:
             logger.error(f"Error getting/creating user: {e}")
             return None
     
     async def get_user(self, telegram_id: int) -> Optional[Dict[str, Any]]:
-        """Get user by telegram ID."""
-        return await self._handle_request(
-            f"getting user {telegram_id}",
-            lambda: self.client.get(f"{self.base_url}/api/v1/users/{telegram_id}"),
-            None
+        """Get user by telegram ID (cached briefly)."""
+        return await user_cache.get_or_load(
+            telegram_id,
+            lambda: self._handle_request(
+                f"getting user {telegram_id}",
+                lambda: self.client.get(f"{self.base_url}/api/v1/users/{telegram_id}"),
+                None
+            ),
         )
     
     async def update_user(
@@ -73,7 +83,7 @@ class UserService(BaseAPIClient):
         bonus_channels_count: Optional[int] = None,
         initial_best_post_sent: Optional[bool] = None,
     ) -> Optional[Dict[str, Any]]:
-        """Update user fields."""
+        """Update user fields and return the updated user row (None on failure)."""
         data = {}
         if status:
             data["status"] = status
@@ -84,7 +94,7 @@ class UserService(BaseAPIClient):
         if initial_best_post_sent is not None:
             data["initial_best_post_sent"] = initial_best_post_sent
         
-        return await self._handle_request(
+        result = await self._handle_request(
             f"updating user {telegram_id}",
             lambda: self.client.patch(
                 f"{self.base_url}/api/v1/users/{telegram_id}",
@@ -92,9 +102,24 @@ class UserService(BaseAPIClient):
             ),
             None
         )
+        user_cache.invalidate(telegram_id)
+        return result
     
     async def update_activity(self, telegram_id: int) -> bool:
-        """Update user's last activity timestamp."""
+        """Update user's last activity timestamp.
+        
+        Concurrent calls for the same user share one request; the next
+        call after it finishes sends a new one.
+        """
+        task = _activity_inflight.get(telegram_id)
+        if task is None:
+            task = asyncio.ensure_future(self._post_activity(telegram_id))
+            _activity_inflight[telegram_id] = task
+            task.add_done_callback(lambda _: _activity_inflight.pop(telegram_id, None))
+        # One cancelled caller must not cancel the request for the others
+        return await asyncio.shield(task)
+    
+    async def _post_activity(self, telegram_id: int) -> bool:
         try:
             response = await self.client.post(
                 f"{self.base_url}/api/v1/users/activity",
@@ -128,13 +153,17 @@ class UserService(BaseAPIClient):
     
     async def get_user_language(self, telegram_id: int) -> str:
         """Get user's preferred language. Defaults to 'en_US'."""
-        result = await self._handle_request(
-            f"getting user language {telegram_id}",
-            lambda: self.client.get(f"{self.base_url}/api/v1/users/{telegram_id}/language"),
-            {"language": "en_US"},
-            log_error=False  # Don't log 404 as error, it's expected for new users
-        )
-        return result.get("language", "en_US") if isinstance(result, dict) else "en_US"
+        async def load() -> Optional[str]:
+            result = await self._handle_request(
+                f"getting user language {telegram_id}",
+                lambda: self.client.get(f"{self.base_url}/api/v1/users/{telegram_id}/language"),
+                None,
+                log_error=False  # Don't log 404 as error, it's expected for new users
+            )
+            # None is not cached: the user may not exist yet or the API is unavailable
+            return result.get("language", "en_US") if isinstance(result, dict) else None
+        
+        return await user_language_cache.get_or_load(telegram_id, load) or "en_US"
     
     async def set_user_language(self, telegram_id: int, language: str) -> bool:
         """Set user's preferred language."""
@@ -143,7 +172,14 @@ class UserService(BaseAPIClient):
                 f"{self.base_url}/api/v1/users/{telegram_id}/language",
                 json={"language": language}
             )
-            return response.status_code in (200, 204)
+            ok = response.status_code in (200, 204)
+            # The next callback reads the language right away, keep it warm
+            if ok:
+                user_language_cache.set(telegram_id, language)
+            else:
+                user_language_cache.invalidate(telegram_id)
+            user_cache.invalidate(telegram_id)
+            return ok
         except Exception as e:
             logger.error(f"Error setting user language: {e}")
             return False
@@ -4,41 +4,72 @@ HTTP client for communicating with api and user-bot services.
 This module provides a unified interface to all API services.
 """
 
+import asyncio
 import logging
+import time
 import json
 import base64
-from typing import Optional, Dict, Any, List
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Mapping
 import httpx
 import redis.asyncio as aioredis
 from bot.core.config import get_settings
+from bot.utils import TokenBucket
 
 from bot.services.api.users import UserService
 from bot.services.api.channels import ChannelService
 from bot.services.api.posts import PostService
 from bot.services.api.ml import MLService
+from bot.services.api.base import create_api_http_client
+from bot.services.api.cache import recent_scrapes
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
 # TTL for post content cache: 6 hours
 CACHE_TTL_SECONDS = 6 * 60 * 60  # 21600 seconds
+# TTL for a user's best posts ranking (dropped earlier on new interactions/training)
+BEST_POSTS_TTL_SECONDS = 60
+
+# Stand-in for a missing user row, so feed code can read fields without None checks
+EMPTY_USER: Mapping[str, Any] = MappingProxyType({
+    "status": None,
+    "user_role": None,
+    "bonus_channels_count": 0,
+    "initial_best_post_sent": False,
+})
 
 
 class CoreAPIClient:
     """Unified client for api service with all domain services."""
     
     def __init__(self):
-        self.users = UserService()
-        self.channels = ChannelService()
-        self.posts = PostService()
-        self.ml = MLService()
+        # One connection pool shared by all domain services (same host)
+        self.client = create_api_http_client()
+        self.users = UserService(self.client)
+        self.channels = ChannelService(self.client)
+        self.posts = PostService(self.client)
+        self.ml = MLService(self.client)
     
     async def close(self):
-        """Close all service clients."""
-        await self.users.close()
-        await self.channels.close()
-        await self.posts.close()
-        await self.ml.close()
+        """Close the shared HTTP client."""
+        await self.client.aclose()
+    
+    async def get_feed_context(self, telegram_id: int) -> Dict[str, Any]:
+        """
+        Everything needed to render feed menus, fetched in one go.
+        
+        Returns {"user": user row or EMPTY_USER, "exists": whether the row exists,
+        "lang": language, "has_bonus": bool}.
+        """
+        user, lang = await asyncio.gather(
+            self.users.get_user(telegram_id),
+            self.users.get_user_language(telegram_id),
+        )
+        exists = user is not None
+        user = user or EMPTY_USER
+        has_bonus = user.get("bonus_channels_count", 0) >= 1
+        return {"user": user, "exists": exists, "lang": lang, "has_bonus": has_bonus}
     
     # Delegate methods for backward compatibility
     async def get_or_create_user(self, *args, **kwargs):
@@ -81,14 +112,29 @@ class CoreAPIClient:
     async def get_training_posts(self, *args, **kwargs):
         return await self.posts.get_training_posts(*args, **kwargs)
     
-    async def create_interaction(self, *args, **kwargs):
-        return await self.posts.create_interaction(*args, **kwargs)
-    
-    async def get_best_posts(self, *args, **kwargs):
-        return await self.posts.get_best_posts(*args, **kwargs)
-    
-    async def train_model(self, *args, **kwargs):
-        return await self.ml.train_model(*args, **kwargs)
+    async def create_interaction(self, telegram_id: int, *args, **kwargs):
+        result = await self.posts.create_interaction(telegram_id, *args, **kwargs)
+        # The ranking excludes/reweighs rated posts
+        await get_post_cache().invalidate_best_posts(telegram_id)
+        return result
+    
+    async def get_best_posts(self, telegram_id: int, limit: int = 1) -> List[Dict[str, Any]]:
+        """Best posts for the user, cached in Redis for BEST_POSTS_TTL_SECONDS."""
+        post_cache = get_post_cache()
+        cached = await post_cache.get_best_posts(telegram_id, limit)
+        if cached is not None:
+            return cached
+        posts = await self.posts.get_best_posts(telegram_id, limit)
+        # An empty list is also what a failed request returns, so it isn't cached
+        if posts:
+            await post_cache.set_best_posts(telegram_id, limit, posts)
+        return posts
+    
+    async def train_model(self, telegram_id: int, *args, **kwargs):
+        result = await self.ml.train_model(telegram_id, *args, **kwargs)
+        # New relevance scores change the ranking
+        await get_post_cache().invalidate_best_posts(telegram_id)
+        return result
     
     async def check_training_eligibility(self, *args, **kwargs):
         return await self.ml.check_training_eligibility(*args, **kwargs)
@@ -109,7 +155,13 @@ class UserBotClient:
     
     def __init__(self):
         self.base_url = settings.user_bot_url.rstrip("/")
-        self.client = httpx.AsyncClient(timeout=60.0)
+        self.client = httpx.AsyncClient(
+            timeout=60.0,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=60.0),
+        )
+        # Media fetches hit MTProto behind the user-bot; bursts there end in FLOOD_WAIT
+        self._media_bucket = TokenBucket(rate=20, capacity=20)
+        self._media_paused_until = 0.0
     
     async def close(self):
         await self.client.aclose()
@@ -127,7 +179,21 @@ class UserBotClient:
             channel_username: Channel username
             limit: Number of posts to scrape
             for_training: If True, don't store text in DB (only metadata) - text will be fetched on-demand
+        
+        Concurrent and repeated (within a minute) scrapes of the same channel
+        share a single user-bot request.
         """
+        key = (channel_username.lstrip("@").lower(), limit, for_training)
+        return await recent_scrapes.get_or_load(
+            key, lambda: self._scrape_channel(channel_username, limit, for_training)
+        )
+    
+    async def _scrape_channel(
+        self,
+        channel_username: str,
+        limit: int,
+        for_training: bool
+    ) -> Optional[Dict[str, Any]]:
         try:
             response = await self.client.post(
                 f"{self.base_url}/cmd/scrape",
@@ -187,10 +253,21 @@ class UserBotClient:
             if timeout:
                 kwargs["timeout"] = timeout
             
+            # Wait out a flood wait reported by the user-bot, then take a token
+            pause = self._media_paused_until - time.monotonic()
+            if pause > 0:
+                await asyncio.sleep(pause)
+            await self._media_bucket.acquire()
+            
             response = await self.client.get(
                 f"{self.base_url}/media/{media_type}",
                 **kwargs
             )
+            if response.status_code == 429:
+                retry_after = float(response.headers.get("Retry-After") or 5)
+                self._media_paused_until = max(self._media_paused_until, time.monotonic() + retry_after)
+                logger.warning(f"User-bot flood wait, pausing media fetches for {retry_after}s")
+                return None
             if response.status_code == 200:
                 if return_json:
                     data = response.json()
@@ -397,6 +474,44 @@ class PostCacheClient:
             logger.error(f"Error invalidating post cache (post_id={post_id}): {e}")
             return False
 
+    
+    def _get_best_posts_key(self, telegram_id: int) -> str:
+        """Get Redis key for a user's best posts (one hash field per limit)."""
+        return f"posts:best:{telegram_id}"
+    
+    async def get_best_posts(self, telegram_id: int, limit: int) -> Optional[List[Dict[str, Any]]]:
+        """Get cached best posts for user, or None if not cached."""
+        try:
+            redis_client = await self._get_redis_client()
+            data = await redis_client.hget(self._get_best_posts_key(telegram_id), str(limit))
+            return json.loads(data) if data else None
+        except Exception as e:
+            logger.error(f"Error getting best posts from cache (user={telegram_id}): {e}")
+            return None
+    
+    async def set_best_posts(self, telegram_id: int, limit: int, posts: List[Dict[str, Any]]) -> bool:
+        """Cache best posts for user for BEST_POSTS_TTL_SECONDS."""
+        try:
+            redis_client = await self._get_redis_client()
+            cache_key = self._get_best_posts_key(telegram_id)
+            async with redis_client.pipeline(transaction=True) as pipe:
+                pipe.hset(cache_key, str(limit), json.dumps(posts))
+                pipe.expire(cache_key, BEST_POSTS_TTL_SECONDS)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Error caching best posts (user={telegram_id}): {e}")
+            return False
+    
+    async def invalidate_best_posts(self, telegram_id: int) -> bool:
+        """Drop cached best posts for user (all limits)."""
+        try:
+            redis_client = await self._get_redis_client()
+            return await redis_client.delete(self._get_best_posts_key(telegram_id)) > 0
+        except Exception as e:
+            logger.error(f"Error invalidating best posts cache (user={telegram_id}): {e}")
+            return False
+
 
 # Singleton instances
 _core_api_client: Optional[CoreAPIClient] = None
@@ -6,19 +6,35 @@ Handles photo and video prefetching with caching to improve response times.
 
 import asyncio
 import logging
+from collections import OrderedDict
 from typing import Optional, Dict, Tuple, List
+from aiogram.types import Message
 from bot.types import PostData, UserBotServiceProtocol
+from bot.utils import parse_media_ids
 
 logger = logging.getLogger(__name__)
 
 
 class MediaCache:
-    """Thread-safe cache for media files."""
+    """Thread-safe LRU cache for media files."""
     
-    def __init__(self, max_size: int = 30):
-        self._cache: Dict[Tuple[int, int], Dict[str, bytes | List[bytes]]] = {}
+    def __init__(self, max_size: int = 30, max_bytes: int = 256 * 1024 * 1024):
+        self._cache: OrderedDict[Tuple[int, int], Dict[str, bytes | List[bytes]]] = OrderedDict()
+        self._sizes: Dict[Tuple[int, int], int] = {}
+        self._total_bytes = 0
         self._lock = asyncio.Lock()
         self._max_size = max_size
+        self._max_bytes = max_bytes
+    
+    @staticmethod
+    def _nbytes(data: bytes | List[bytes]) -> int:
+        if isinstance(data, list):
+            return sum(len(part) for part in data)
+        return len(data)
+    
+    def _pop(self, key: Tuple[int, int]) -> None:
+        self._cache.pop(key, None)
+        self._total_bytes -= self._sizes.pop(key, 0)
     
     async def get(
         self,
@@ -29,7 +45,11 @@ class MediaCache:
         """Get cached media for a post."""
         async with self._lock:
             key = (chat_id, post_id)
-            return self._cache.get(key, {}).get(media_type)
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            self._cache.move_to_end(key)
+            return entry.get(media_type)
     
     async def set(
         self,
@@ -43,23 +63,67 @@ class MediaCache:
             key = (chat_id, post_id)
             if key not in self._cache:
                 self._cache[key] = {}
-            self._cache[key][media_type] = data
+            else:
+                self._cache.move_to_end(key)
+            entry = self._cache[key]
+            old = entry.get(media_type)
+            delta = self._nbytes(data) - (self._nbytes(old) if old is not None else 0)
+            entry[media_type] = data
+            self._sizes[key] = self._sizes.get(key, 0) + delta
+            self._total_bytes += delta
             
-            # Cleanup old entries if cache is too large
-            if len(self._cache) > self._max_size:
-                keys = list(self._cache.keys())
-                for k in keys[:-self._max_size]:
-                    self._cache.pop(k, None)
+            # Evict least recently used entries if cache is too large,
+            # either by entry count or by total size of the cached blobs
+            while len(self._cache) > 1 and (
+                len(self._cache) > self._max_size or self._total_bytes > self._max_bytes
+            ):
+                self._pop(next(iter(self._cache)))
     
     async def clear(self, chat_id: Optional[int] = None) -> None:
         """Clear cache for a chat or all chats."""
         async with self._lock:
             if chat_id is None:
                 self._cache.clear()
+                self._sizes.clear()
+                self._total_bytes = 0
             else:
                 keys_to_remove = [k for k in self._cache.keys() if k[0] == chat_id]
                 for k in keys_to_remove:
-                    self._cache.pop(k, None)
+                    self._pop(k)
+
+
+class FileIdCache:
+    """LRU of Telegram file_ids for channel media the bot has already uploaded.
+    
+    A file_id can be re-sent to any chat without transferring the bytes again.
+    """
+    
+    def __init__(self, max_size: int = 4096):
+        self._file_ids: OrderedDict[Tuple[str, int], str] = OrderedDict()
+        self._max_size = max_size
+    
+    def get(self, channel_username: str, media_id: int) -> Optional[str]:
+        key = (channel_username, media_id)
+        file_id = self._file_ids.get(key)
+        if file_id is not None:
+            self._file_ids.move_to_end(key)
+        return file_id
+    
+    def set(self, channel_username: str, media_id: int, file_id: str) -> None:
+        key = (channel_username, media_id)
+        self._file_ids[key] = file_id
+        self._file_ids.move_to_end(key)
+        while len(self._file_ids) > self._max_size:
+            self._file_ids.popitem(last=False)
+    
+    def remember(self, channel_username: str, media_id: int, message: Optional[Message]) -> None:
+        """Store the file_id of the photo in a message the bot just sent."""
+        if message is not None and message.photo:
+            self.set(channel_username, media_id, message.photo[-1].file_id)
+
+
+# Shared across chats: file_ids stay valid for the same bot
+media_file_ids = FileIdCache()
 
 
 class MediaService:
@@ -69,6 +133,8 @@ class MediaService:
         self.user_bot = user_bot
         self.cache = MediaCache()
         self._prefetch_tasks: Dict[Tuple[int, int], asyncio.Task] = {}
+        # Fixed window of concurrent post downloads; a finished post frees its slot at once
+        self._download_slots = asyncio.Semaphore(5)
     
     async def prefetch_post_media(
         self,
@@ -91,6 +157,13 @@ class MediaService:
         if cache_key in self._prefetch_tasks:
             return
         
+        # Photos the bot already uploaded are re-sent by file_id, nothing to download
+        if post.get("media_type") == "photo":
+            channel_username = post.get("channel_username", "").lstrip("@")
+            media_ids = parse_media_ids(post)
+            if media_ids and all(media_file_ids.get(channel_username, mid) for mid in media_ids):
+                return
+        
         # Start prefetch task
         task = asyncio.create_task(
             self._prefetch_single_post(chat_id, post)
@@ -115,45 +188,50 @@ class MediaService:
             return
         
         try:
-            if media_type == "photo":
-                media_ids_str = post.get("media_file_id") or ""
-                media_ids: List[int] = []
-                
-                if media_ids_str:
-                    for part in media_ids_str.split(","):
-                        part = part.strip()
-                        if part.isdigit():
-                            media_ids.append(int(part))
-                
-                if media_ids:
-                    # Parallel download all photos in album
-                    tasks = [
-                        self.user_bot.get_photo(channel_username, mid)
-                        for mid in media_ids[:5]
-                    ]
-                    results = await asyncio.gather(*tasks, return_exceptions=True)
-                    photos = [
-                        r for r in results
-                        if r and not isinstance(r, Exception)
-                    ]
-                    
-                    if photos:
-                        await self.cache.set(chat_id, post_id, "photo", photos[0])
-                        if len(photos) > 1:
-                            await self.cache.set(chat_id, post_id, "photos", photos)
-            
-            elif media_type == "video":
-                msg_id = post.get("telegram_message_id")
-                if msg_id:
-                    video_bytes = await self.user_bot.get_video(channel_username, msg_id)
-                    if video_bytes:
-                        await self.cache.set(chat_id, post_id, "video", video_bytes)
+            async with self._download_slots:
+                await self._download_post_media(chat_id, post, media_type, channel_username)
         except Exception as e:
             logger.debug(f"Prefetch failed for post {post_id}: {e}")
         finally:
             # Remove task from tracking
             self._prefetch_tasks.pop(cache_key, None)
     
+    async def _download_post_media(
+        self,
+        chat_id: int,
+        post: PostData,
+        media_type: Optional[str],
+        channel_username: str
+    ) -> None:
+        """Download a post's media into the cache."""
+        post_id = post["id"]
+        if media_type == "photo":
+            media_ids = parse_media_ids(post)
+            
+            if media_ids:
+                # Parallel download all photos in album
+                tasks = [
+                    self.user_bot.get_photo(channel_username, mid)
+                    for mid in media_ids[:5]
+                ]
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+                photos = [
+                    r for r in results
+                    if r and not isinstance(r, Exception)
+                ]
+                
+                if photos:
+                    await self.cache.set(chat_id, post_id, "photo", photos[0])
+                    if len(photos) > 1:
+                        await self.cache.set(chat_id, post_id, "photos", photos)
+        
+        elif media_type == "video":
+            msg_id = post.get("telegram_message_id")
+            if msg_id:
+                video_bytes = await self.user_bot.get_video(channel_username, msg_id)
+                if video_bytes:
+                    await self.cache.set(chat_id, post_id, "video", video_bytes)
+    
     async def prefetch_posts_media(
         self,
         chat_id: int,
@@ -176,17 +254,18 @@ class MediaService:
         chat_id: int,
         posts: List[PostData]
     ) -> None:
-        """Prefetch ALL posts in parallel batches."""
-        batch_size = 5
-        for i in range(0, len(posts), batch_size):
-            batch = posts[i:i + batch_size]
-            tasks = [
-                self.prefetch_post_media(chat_id, post)
-                for post in batch
-            ]
-            await asyncio.gather(*tasks, return_exceptions=True)
-            # Small delay between batches to not overwhelm
-            await asyncio.sleep(0.1)
+        """Prefetch ALL posts; downloads are capped by the shared semaphore."""
+        for post in posts:
+            await self.prefetch_post_media(chat_id, post)
+    
+    async def _wait_prefetch(self, chat_id: int, post_id: int) -> None:
+        """Wait for a running prefetch of this post so its result isn't downloaded twice."""
+        task = self._prefetch_tasks.get((chat_id, post_id))
+        if task is not None:
+            try:
+                await asyncio.shield(task)
+            except Exception:
+                pass
     
     async def get_cached_photo(
         self,
@@ -194,6 +273,7 @@ class MediaService:
         post_id: int
     ) -> Optional[bytes]:
         """Get cached photo bytes for a post."""
+        await self._wait_prefetch(chat_id, post_id)
         result = await self.cache.get(chat_id, post_id, "photo")
         if isinstance(result, bytes):
             return result
@@ -205,6 +285,7 @@ class MediaService:
         post_id: int
     ) -> Optional[List[bytes]]:
         """Get cached photo album bytes for a post."""
+        await self._wait_prefetch(chat_id, post_id)
         result = await self.cache.get(chat_id, post_id, "photos")
         if isinstance(result, list):
             return result
@@ -216,6 +297,7 @@ class MediaService:
         post_id: int
     ) -> Optional[bytes]:
         """Get cached video bytes for a post."""
+        await self._wait_prefetch(chat_id, post_id)
         result = await self.cache.get(chat_id, post_id, "video")
         if isinstance(result, bytes):
             return result
@@ -10,7 +10,8 @@ from aiogram.types import InlineKeyboardMarkup, InputMediaPhoto, BufferedInputFi
 
 from bot.types import PostData, PostServiceProtocol, MediaServiceProtocol, UserBotServiceProtocol
 from bot.core.message_manager import MessageManager
-from bot.utils import format_post_text, parse_media_ids, TELEGRAM_CAPTION_LIMIT
+from bot.services.media_service import media_file_ids
+from bot.utils import fits_in_caption, format_post_text, parse_media_ids
 
 logger = logging.getLogger(__name__)
 
@@ -56,8 +57,6 @@ class PostService:
         Returns:
             Tuple of (sent_with_media: bool, media_message_ids: List[int])
         """
-        from bot.utils import get_html_text_length
-        
         # Check if text is already formatted (contains HTML links or special formatting)
         post_text = post.get("text", "")
         if not post_text or (not post_text.startswith("📰") and not "<a href" in post_text):
@@ -65,7 +64,7 @@ class PostService:
             post_text = format_post_text(post, include_relevance=include_relevance)
         
         # Use HTML text length for caption limit check
-        caption_fits = get_html_text_length(post_text) <= TELEGRAM_CAPTION_LIMIT
+        caption_fits = fits_in_caption(post_text)
         sent_with_media = False
         media_message_ids: List[int] = []
         
@@ -85,28 +84,33 @@ class PostService:
             if channel_username and media_ids:
                 if len(media_ids) > 1:
                     # Album: send media group, then text separately
+                    # (by file_id when every photo was uploaded before)
+                    album_file_ids = [media_file_ids.get(channel_username, mid) for mid in media_ids]
                     media_items: List[InputMediaPhoto] = []
-                    for mid in media_ids:
-                        try:
-                            cached_photos = await self.media_service.get_cached_photos(
-                                chat_id, post.get("id", 0)
-                            )
-                            if cached_photos and mid in media_ids[:len(cached_photos)]:
-                                idx = media_ids.index(mid)
-                                if idx < len(cached_photos):
-                                    photo_bytes = cached_photos[idx]
+                    if all(album_file_ids):
+                        media_items = [InputMediaPhoto(media=file_id) for file_id in album_file_ids]
+                    else:
+                        for mid in media_ids:
+                            try:
+                                cached_photos = await self.media_service.get_cached_photos(
+                                    chat_id, post.get("id", 0)
+                                )
+                                if cached_photos and mid in media_ids[:len(cached_photos)]:
+                                    idx = media_ids.index(mid)
+                                    if idx < len(cached_photos):
+                                        photo_bytes = cached_photos[idx]
+                                    else:
+                                        photo_bytes = await self.user_bot.get_photo(channel_username, mid)
                                 else:
                                     photo_bytes = await self.user_bot.get_photo(channel_username, mid)
-                            else:
-                                photo_bytes = await self.user_bot.get_photo(channel_username, mid)
-                        except Exception:
-                            photo_bytes = None
-                        
-                        if not photo_bytes:
-                            continue
-                        
-                        input_file = BufferedInputFile(photo_bytes, filename=f"{mid}.jpg")
-                        media_items.append(InputMediaPhoto(media=input_file))
+                            except Exception:
+                                photo_bytes = None
+                            
+                            if not photo_bytes:
+                                continue
+                            
+                            input_file = BufferedInputFile(photo_bytes, filename=f"{mid}.jpg")
+                            media_items.append(InputMediaPhoto(media=input_file))
                     
                     if media_items:
                         msgs = await self.message_manager.bot.send_media_group(
@@ -115,6 +119,9 @@ class PostService:
                         )
                         media_message_ids.extend(m.message_id for m in msgs)
                         sent_with_media = True
+                        if len(msgs) == len(media_ids):
+                            for mid, msg in zip(media_ids, msgs):
+                                media_file_ids.remember(channel_username, mid, msg)
                         
                         # Send text separately after album
                         await send_method(
@@ -125,38 +132,45 @@ class PostService:
                 else:
                     # Single photo with caption
                     mid = media_ids[0]
-                    try:
-                        cached_photo = await self.media_service.get_cached_photo(
-                            chat_id, post.get("id", 0)
-                        )
-                        if cached_photo:
-                            photo_bytes = cached_photo
-                        else:
-                            photo_bytes = await self.user_bot.get_photo(channel_username, mid)
-                    except Exception:
-                        photo_bytes = None
+                    photo_file_id = media_file_ids.get(channel_username, mid)
+                    photo_bytes = None
+                    if not photo_file_id:
+                        try:
+                            cached_photo = await self.media_service.get_cached_photo(
+                                chat_id, post.get("id", 0)
+                            )
+                            if cached_photo:
+                                photo_bytes = cached_photo
+                            else:
+                                photo_bytes = await self.user_bot.get_photo(channel_username, mid)
+                        except Exception:
+                            photo_bytes = None
                     
-                    if photo_bytes:
+                    if photo_file_id or photo_bytes:
                         if caption_fits:
                             # Photo + caption together (no buttons here)
                             if message_type == "temporary" or message_type == "ephemeral":
                                 await self.message_manager.delete_temporary(chat_id, tag=tag)
                             
-                            await send_method(
+                            msg = await send_method(
                                 chat_id,
                                 post_text,
                                 tag=tag,
+                                photo=photo_file_id,
                                 photo_bytes=photo_bytes,
                                 photo_filename=f"{mid}.jpg",
                             )
+                            if not photo_file_id:
+                                media_file_ids.remember(channel_username, mid, msg)
                             sent_with_media = True
                         else:
                             # Photo without caption, text separately
-                            input_file = BufferedInputFile(photo_bytes, filename=f"{mid}.jpg")
                             msg = await self.message_manager.bot.send_photo(
                                 chat_id=chat_id,
-                                photo=input_file,
+                                photo=photo_file_id or BufferedInputFile(photo_bytes, filename=f"{mid}.jpg"),
                             )
+                            if not photo_file_id:
+                                media_file_ids.remember(channel_username, mid, msg)
                             media_message_ids.append(msg.message_id)
                             sent_with_media = True
                             
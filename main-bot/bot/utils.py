@@ -1,11 +1,146 @@
-from typing import Any, Dict, List, Optional, Tuple
-from aiogram.types import BufferedInputFile, InputMediaPhoto, InlineKeyboardMarkup
+import asyncio
+import functools
+import logging
+import re
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
+from aiogram.types import BufferedInputFile, CallbackQuery, InputMediaPhoto, InlineKeyboardMarkup
 
 # Telegram caption limit
 TELEGRAM_CAPTION_LIMIT = 1024
 
+# Post header/body templates, built once instead of per rendered post
+POST_HEADER_LINK_TPL = '📰 <a href="https://t.me/{username}/{message_id}">{title}</a>\n\n'
+POST_HEADER_TITLE_TPL = "📰 <b>{title}</b>\n\n"
+MEDIA_PLACEHOLDER = "<i>[Media content]</i>"
+
 import html as html_module
 
+logger = logging.getLogger(__name__)
+
+# Strong references to background tasks so they are not garbage collected
+_background_tasks: set = set()
+
+
+def _on_background_done(task: asyncio.Task) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Background task failed: %r", task.exception())
+
+
+def fire_and_forget(coro: Awaitable[Any]) -> asyncio.Task:
+    """Run a side effect whose result nobody waits for (activity, logs, toasts)."""
+    task = asyncio.ensure_future(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_background_done)
+    return task
+
+
+# (user_id, callback data) pairs whose handler is currently running
+_inflight_callbacks: set = set()
+
+
+def single_flight(handler):
+    """Drop repeated taps on the same button while its handler is still running.
+    
+    The duplicate tap is only answered (so the button stops spinning);
+    the key is released when the first invocation finishes.
+    """
+    @functools.wraps(handler)
+    async def wrapper(callback: CallbackQuery, *args, **kwargs):
+        key = (callback.from_user.id, callback.data)
+        if key in _inflight_callbacks:
+            try:
+                await callback.answer()
+            except Exception:
+                pass
+            return None
+        _inflight_callbacks.add(key)
+        try:
+            return await handler(callback, *args, **kwargs)
+        finally:
+            _inflight_callbacks.discard(key)
+    return wrapper
+
+
+class TokenBucket:
+    """Token bucket: `rate` tokens per second, bursts of up to `capacity`."""
+    
+    __slots__ = ("rate", "capacity", "tokens", "updated_at", "lock")
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class TTLSet:
+    """Bounded set whose members expire after `ttl` seconds (oldest evicted first)."""
+    
+    def __init__(self, max_size: int = 2048, ttl: float = 10.0):
+        self._max_size = max_size
+        self._ttl = ttl
+        self._expiry: OrderedDict[Any, float] = OrderedDict()
+    
+    def _evict(self, now: float) -> None:
+        while self._expiry and (
+            len(self._expiry) > self._max_size or next(iter(self._expiry.values())) <= now
+        ):
+            self._expiry.popitem(last=False)
+    
+    def add(self, key: Any) -> None:
+        now = time.monotonic()
+        self._expiry.pop(key, None)
+        self._expiry[key] = now + self._ttl
+        self._evict(now)
+    
+    def discard(self, key: Any) -> None:
+        self._expiry.pop(key, None)
+    
+    def __contains__(self, key: Any) -> bool:
+        expires_at = self._expiry.get(key)
+        return expires_at is not None and expires_at > time.monotonic()
+    
+    def __len__(self) -> int:
+        self._evict(time.monotonic())
+        return len(self._expiry)
+
+
+@functools.lru_cache(maxsize=512)
+def escape_channel_title(title: str) -> str:
+    """HTML-escape a channel title (memoized: the same few titles repeat across posts)."""
+    return html_module.escape(title)
+
+
+# "@name", "t.me/name" or "https://t.me/name" (optional trailing slash / query string)
+_CHANNEL_USERNAME_RE = re.compile(
+    r"^(?:(?:https?://)?t\.me/|@)(?P<u>[A-Za-z0-9_]{4,32})/?(?:\?\S*)?$"
+)
+
+
+def parse_channel_username(channel_input: str) -> Optional[str]:
+    """Extract "@username" from user input, or None if it isn't a public channel reference."""
+    match = _CHANNEL_USERNAME_RE.match(channel_input.strip())
+    if not match:
+        return None
+    return "@" + match.group("u")
+
 
 async def get_user_lang(user_id: int) -> str:
     """Get user's language preference."""
@@ -285,6 +420,9 @@ def markdown_v2_to_html(text: str) -> str:
     return ''.join(parts)
 
 
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+
 def get_html_text_length(html_text: str) -> int:
     """Get the length of HTML text as Telegram counts it (excluding tags).
     
@@ -296,12 +434,20 @@ def get_html_text_length(html_text: str) -> int:
     Returns:
         Length of text without HTML tags
     """
-    import re
     # Remove HTML tags
-    text_without_tags = re.sub(r'<[^>]+>', '', html_text)
+    text_without_tags = _HTML_TAG_RE.sub('', html_text)
     return len(text_without_tags)
 
 
+def fits_in_caption(html_text: str) -> bool:
+    """Whether HTML text fits in a media caption (TELEGRAM_CAPTION_LIMIT visible chars).
+    
+    The raw length bounds the visible length from above, so short texts
+    skip stripping the tags.
+    """
+    return len(html_text) <= TELEGRAM_CAPTION_LIMIT or get_html_text_length(html_text) <= TELEGRAM_CAPTION_LIMIT
+
+
 def format_post_text(
     post: Dict[str, Any],
     include_relevance: bool = False,
@@ -315,8 +461,7 @@ def format_post_text(
     Returns:
         Formatted HTML text
     """
-    import html
-    channel_title = html.escape(post.get("channel_title", "Unknown"))
+    channel_title = escape_channel_title(post.get("channel_title", "Unknown"))
     full_text_raw = post.get("text") or ""
     text = full_text_raw  # Already HTML formatted from user-bot, don't escape
     
@@ -328,10 +473,14 @@ def format_post_text(
     else:
         header += "\n"
     
-    body = text if text else "<i>[Media content]</i>"
+    body = text if text else MEDIA_PLACEHOLDER
     return header + body
 
 
+# One comma-separated item that is entirely digits (surrounding whitespace allowed)
+_MEDIA_ID_RE = re.compile(r"(?:^|,)\s*(\d+)\s*(?=,|$)")
+
+
 def parse_media_ids(post: Dict[str, Any]) -> List[int]:
     """Extract media message IDs from post data.
     
@@ -339,23 +488,63 @@ def parse_media_ids(post: Dict[str, Any]) -> List[int]:
         post: Post data dict with 'media_file_id' or 'telegram_message_id'
     
     Returns:
-        List of telegram message IDs for media
+        List of telegram message IDs for media (parsed once and memoized
+        on the post as "media_ids")
     """
+    if "media_ids" in post:
+        return post["media_ids"]
     media_ids_str = post.get("media_file_id") or ""
     media_ids: List[int] = []
     
     if media_ids_str:
-        for part in media_ids_str.split(","):
-            part = part.strip()
-            if part.isdigit():
-                media_ids.append(int(part))
+        media_ids = list(map(int, _MEDIA_ID_RE.findall(media_ids_str)))
     else:
         msg_id = post.get("telegram_message_id")
         if isinstance(msg_id, int):
             media_ids.append(msg_id)
     
+    post["media_ids"] = media_ids
     return media_ids
 
 
+def _posted_at_ts(post: Dict[str, Any]) -> Optional[float]:
+    """Epoch seconds of post["posted_at"], parsed once and memoized on the post."""
+    if "posted_at_ts" in post:
+        return post["posted_at_ts"]
+    ts = None
+    posted_at_raw = post.get("posted_at")
+    if posted_at_raw:
+        try:
+            posted_at = datetime.fromisoformat(posted_at_raw)
+        except (TypeError, ValueError):
+            posted_at = None
+        if posted_at is not None:
+            # Naive timestamps from the API are UTC
+            if posted_at.tzinfo is None:
+                posted_at = posted_at.replace(tzinfo=timezone.utc)
+            ts = posted_at.timestamp()
+    post["posted_at_ts"] = ts
+    return ts
+
+
+def pick_initial_best_post(
+    posts: List[Dict[str, Any]],
+    max_age: float = 3 * 86400,
+) -> Optional[Dict[str, Any]]:
+    """Pick the one-time "best post" to highlight.
+    
+    Posts are expected best-first; returns the first one posted within
+    `max_age` seconds, or the overall best if none is that recent.
+    """
+    if not posts:
+        return None
+    threshold_ts = time.time() - max_age
+    for post in posts:
+        ts = _posted_at_ts(post)
+        if ts is not None and ts >= threshold_ts:
+            return post
+    return posts[0]
+
+
 # DEPRECATED: send_post_with_media and cleanup_media_messages moved to services/post_service.py
 # These functions are kept for backwards compatibility but should not be used in new code.
@@ -3,6 +3,7 @@ Media download endpoints.
 """
 import logging
 from fastapi import APIRouter, HTTPException, Response
+from telethon.errors import FloodWaitError
 
 from app.services import get_telethon_service, MediaService
 
@@ -26,7 +27,8 @@ async def get_photo(channel_username: str, message_id: int):
         Photo bytes as JPEG image
         
     Raises:
-        HTTPException: 503 if Telethon not connected, 404 if photo not found
+        HTTPException: 503 if Telethon not connected, 404 if photo not found,
+            429 with Retry-After on Telegram flood wait
     """
     telethon_service = get_telethon_service()
     
@@ -34,7 +36,10 @@ async def get_photo(channel_username: str, message_id: int):
         raise HTTPException(status_code=503, detail="Telethon client not connected")
     
     media_service = MediaService(telethon_service)
-    data = await media_service.download_photo(channel_username, message_id)
+    try:
+        data = await media_service.download_photo(channel_username, message_id)
+    except FloodWaitError as e:
+        raise HTTPException(status_code=429, detail="Rate limited", headers={"Retry-After": str(e.seconds)})
     
     if not data:
         raise HTTPException(status_code=404, detail="Photo not found")
@@ -57,7 +62,8 @@ async def get_video(channel_username: str, message_id: int):
         Video bytes as MP4 video
         
     Raises:
-        HTTPException: 503 if Telethon not connected, 404 if video not found
+        HTTPException: 503 if Telethon not connected, 404 if video not found,
+            429 with Retry-After on Telegram flood wait
     """
     telethon_service = get_telethon_service()
     
@@ -65,7 +71,10 @@ async def get_video(channel_username: str, message_id: int):
         raise HTTPException(status_code=503, detail="Telethon client not connected")
     
     media_service = MediaService(telethon_service)
-    data = await media_service.download_video(channel_username, message_id)
+    try:
+        data = await media_service.download_video(channel_username, message_id)
+    except FloodWaitError as e:
+        raise HTTPException(status_code=429, detail="Rate limited", headers={"Retry-After": str(e.seconds)})
     
     if not data:
         raise HTTPException(status_code=404, detail="Video not found")
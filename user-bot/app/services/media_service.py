@@ -6,6 +6,7 @@ import io
 from typing import Optional
 
 from PIL import Image
+from telethon.errors import FloodWaitError
 
 from app.core.utils import get_message_html
 from app.types import MediaServiceProtocol, TelethonServiceProtocol
@@ -58,6 +59,9 @@ class MediaService:
             
             # Compress photo for faster loading
             return self._compress_image(data)
+        except FloodWaitError:
+            # Let the caller tell main-bot to back off
+            raise
         except Exception as e:
             logger.error(f"Error downloading photo from @{username} (msg {message_id}): {e}")
             return None
@@ -129,6 +133,9 @@ class MediaService:
             # Fallback: if no thumbnail, return None (don't download full video)
             logger.warning(f"No thumbnail available for video @{username} (msg {message_id})")
             return None
+        except FloodWaitError:
+            # Let the caller tell main-bot to back off
+            raise
         except Exception as e:
             logger.error(f"Error downloading video thumbnail from @{username} (msg {message_id}): {e}")
             return None